@@ -9,16 +9,11 @@ from collections import defaultdict
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
-from .data_model import Product, ExtractionSession, PageContent, FieldLocation
-from .pdf_reader import (
-    PDFReader,
-    CAMELOT_AVAILABLE,
-    DOCLING_AVAILABLE,
-    IMG2TABLE_AVAILABLE,
-    PYMUPDF4LLM_AVAILABLE,
-    PYMUPDF_AVAILABLE,
-    UNSTRUCTURED_AVAILABLE,
-)
+from .data_model import Product, ExtractionSession, PageContent, FieldLocation, TableCell
+# Backend flags are read through the module: a backend that is installed but
+# fails its first import is switched off there at runtime
+from . import pdf_reader
+from .pdf_reader import PDFReader
 
 console = Console()
 
@@ -989,9 +984,9 @@ def parse_markdown_tables(text: str) -> list[list[list[str]]]:
 
 
 def _get_cell_text(cell) -> str:
-    """Get text from a cell, handling both string and dict formats."""
-    if isinstance(cell, dict):
-        return (cell.get('text') or '').strip()
+    """Get text from a cell, handling both string and TableCell formats."""
+    if isinstance(cell, TableCell):
+        return cell.text.strip()
     return (cell or '').strip()
 
 
@@ -1032,7 +1027,7 @@ def combine_identifiers(upc: str, sku: str, item_no: str) -> str:
 def find_count_column(table: list[list]) -> int:
     """Find which column contains count data (e.g., '32 ct.', '1 pk').
 
-    Works with both string lists and dict lists (with 'text' and 'bbox' keys).
+    Works with both string lists and TableCell lists.
 
     Returns the column index, or -1 if no valid count column found.
     """
@@ -1073,9 +1068,9 @@ def find_count_column(table: list[list]) -> int:
 
 
 def _get_cell_bbox(cell) -> tuple | None:
-    """Get bbox from a cell, handling both string and dict formats."""
-    if isinstance(cell, dict):
-        return cell.get('bbox')
+    """Get bbox from a cell, handling both string and TableCell formats."""
+    if isinstance(cell, TableCell):
+        return cell.bbox
     return None
 
 
@@ -1090,7 +1085,7 @@ def extract_products_from_table(table: list[list], page_number: int, source_file
 
     Uses header detection to map columns, with optional robust content-based
     detection as fallback.
-    Works with both string lists and dict lists (with 'text' and 'bbox' keys).
+    Works with both string lists and TableCell lists.
 
     Args:
         table: List of rows (each row is a list of cells)
@@ -1556,15 +1551,15 @@ class AutoExtractor:
             console.print(f"[bold blue]Auto-extracting:[/bold blue] {self.pdf_path.name}")
             # Show availability of optional extractors
             unavailable = []
-            if not CAMELOT_AVAILABLE:
+            if not pdf_reader.CAMELOT_AVAILABLE:
                 unavailable.append("Camelot")
-            if not DOCLING_AVAILABLE:
+            if not pdf_reader.DOCLING_AVAILABLE:
                 unavailable.append("Docling")
-            if not UNSTRUCTURED_AVAILABLE:
+            if not pdf_reader.UNSTRUCTURED_AVAILABLE:
                 unavailable.append("unstructured")
-            if not IMG2TABLE_AVAILABLE:
+            if not pdf_reader.IMG2TABLE_AVAILABLE:
                 unavailable.append("img2table")
-            if not PYMUPDF4LLM_AVAILABLE:
+            if not pdf_reader.PYMUPDF4LLM_AVAILABLE:
                 unavailable.append("pymupdf4llm")
             if unavailable:
                 console.print(f"[yellow]Note: {', '.join(unavailable)} not available[/yellow]")
@@ -1688,41 +1683,41 @@ class AutoExtractor:
         if pdf_info['is_scanned']:
             # Scanned documents - use AI/vision methods
             pipeline_methods = [
-                ('docling', self._try_docling, DOCLING_AVAILABLE),
-                ('unstructured', self._try_unstructured, UNSTRUCTURED_AVAILABLE),
+                ('docling', self._try_docling, pdf_reader.DOCLING_AVAILABLE),
+                ('unstructured', self._try_unstructured, pdf_reader.UNSTRUCTURED_AVAILABLE),
             ]
         elif pdf_info['has_borders']:
             # Digital PDF with bordered tables
             pipeline_methods = [
-                ('camelot', self._try_camelot, CAMELOT_AVAILABLE),
+                ('camelot', self._try_camelot, pdf_reader.CAMELOT_AVAILABLE),
                 ('pdfplumber', self._try_pdfplumber_tables, True),
-                ('pymupdf', self._try_pymupdf, PYMUPDF_AVAILABLE),
+                ('pymupdf', self._try_pymupdf, pdf_reader.PYMUPDF_AVAILABLE),
                 ('pdfminer', self._try_pdfminer_layout, True),
             ]
         elif pdf_info['layout_type'] == 'borderless':
             # Borderless tables
             pipeline_methods = [
-                ('img2table', self._try_img2table, IMG2TABLE_AVAILABLE),
+                ('img2table', self._try_img2table, pdf_reader.IMG2TABLE_AVAILABLE),
                 ('pdfplumber', self._try_pdfplumber_tables, True),
-                ('docling', self._try_docling, DOCLING_AVAILABLE),
-                ('pymupdf4llm', self._try_pymupdf4llm, PYMUPDF4LLM_AVAILABLE),
+                ('docling', self._try_docling, pdf_reader.DOCLING_AVAILABLE),
+                ('pymupdf4llm', self._try_pymupdf4llm, pdf_reader.PYMUPDF4LLM_AVAILABLE),
             ]
         elif pdf_info['layout_type'] == 'text-only':
             # Text-only documents
             pipeline_methods = [
-                ('pymupdf4llm', self._try_pymupdf4llm, PYMUPDF4LLM_AVAILABLE),
+                ('pymupdf4llm', self._try_pymupdf4llm, pdf_reader.PYMUPDF4LLM_AVAILABLE),
                 ('pdfminer', self._try_pdfminer_layout, True),
             ]
         else:
             # Default: try all methods in confidence order
             pipeline_methods = [
-                ('camelot', self._try_camelot, CAMELOT_AVAILABLE),
-                ('docling', self._try_docling, DOCLING_AVAILABLE),
+                ('camelot', self._try_camelot, pdf_reader.CAMELOT_AVAILABLE),
+                ('docling', self._try_docling, pdf_reader.DOCLING_AVAILABLE),
                 ('pdfplumber', self._try_pdfplumber_tables, True),
-                ('pymupdf', self._try_pymupdf, PYMUPDF_AVAILABLE),
-                ('unstructured', self._try_unstructured, UNSTRUCTURED_AVAILABLE),
-                ('img2table', self._try_img2table, IMG2TABLE_AVAILABLE),
-                ('pymupdf4llm', self._try_pymupdf4llm, PYMUPDF4LLM_AVAILABLE),
+                ('pymupdf', self._try_pymupdf, pdf_reader.PYMUPDF_AVAILABLE),
+                ('unstructured', self._try_unstructured, pdf_reader.UNSTRUCTURED_AVAILABLE),
+                ('img2table', self._try_img2table, pdf_reader.IMG2TABLE_AVAILABLE),
+                ('pymupdf4llm', self._try_pymupdf4llm, pdf_reader.PYMUPDF4LLM_AVAILABLE),
                 ('pdfminer', self._try_pdfminer_layout, True),
             ]
 
@@ -1840,7 +1835,7 @@ class AutoExtractor:
 
     def _try_docling(self, reader: PDFReader, page_num: int) -> list[Product]:
         """Try extraction using Docling (IBM) - AI-powered table detection."""
-        if not DOCLING_AVAILABLE:
+        if not pdf_reader.DOCLING_AVAILABLE:
             return []
 
         tables = reader.extract_tables_docling(page_num)
@@ -1848,7 +1843,7 @@ class AutoExtractor:
 
         for table_data in tables:
             extracted = extract_products_from_table(
-                table_data['rows'], page_num, self.pdf_path.name
+                table_data.rows, page_num, self.pdf_path.name
             )
             # Update confidence to Docling level
             for product in extracted:
@@ -1860,7 +1855,7 @@ class AutoExtractor:
 
     def _try_camelot(self, reader: PDFReader, page_num: int) -> list[Product]:
         """Try extraction using Camelot."""
-        if not CAMELOT_AVAILABLE:
+        if not pdf_reader.CAMELOT_AVAILABLE:
             return []
 
         tables = reader.extract_tables_camelot(page_num)
@@ -1868,7 +1863,7 @@ class AutoExtractor:
 
         for table_data in tables:
             extracted = extract_products_from_table(
-                table_data['rows'], page_num, self.pdf_path.name
+                table_data.rows, page_num, self.pdf_path.name
             )
             # Update confidence to Camelot level
             for product in extracted:
@@ -1880,7 +1875,7 @@ class AutoExtractor:
 
     def _try_unstructured(self, reader: PDFReader, page_num: int) -> list[Product]:
         """Try extraction using unstructured.io - document understanding with layout analysis."""
-        if not UNSTRUCTURED_AVAILABLE:
+        if not pdf_reader.UNSTRUCTURED_AVAILABLE:
             return []
 
         tables = reader.extract_tables_unstructured(page_num)
@@ -1888,7 +1883,7 @@ class AutoExtractor:
 
         for table_data in tables:
             extracted = extract_products_from_table(
-                table_data['rows'], page_num, self.pdf_path.name
+                table_data.rows, page_num, self.pdf_path.name
             )
             # Update confidence to unstructured level
             for product in extracted:
@@ -1900,7 +1895,7 @@ class AutoExtractor:
 
     def _try_pymupdf(self, reader: PDFReader, page_num: int) -> list[Product]:
         """Try extraction using PyMuPDF - fast native table detection."""
-        if not PYMUPDF_AVAILABLE:
+        if not pdf_reader.PYMUPDF_AVAILABLE:
             return []
 
         tables = reader.extract_tables_pymupdf(page_num)
@@ -1908,7 +1903,7 @@ class AutoExtractor:
 
         for table_data in tables:
             extracted = extract_products_from_table(
-                table_data['rows'], page_num, self.pdf_path.name
+                table_data.rows, page_num, self.pdf_path.name
             )
             # Update confidence to PyMuPDF level
             for product in extracted:
@@ -1920,7 +1915,7 @@ class AutoExtractor:
 
     def _try_img2table(self, reader: PDFReader, page_num: int) -> list[Product]:
         """Try extraction using img2table - borderless table specialist."""
-        if not IMG2TABLE_AVAILABLE:
+        if not pdf_reader.IMG2TABLE_AVAILABLE:
             return []
 
         tables = reader.extract_tables_img2table(page_num)
@@ -1928,7 +1923,7 @@ class AutoExtractor:
 
         for table_data in tables:
             extracted = extract_products_from_table(
-                table_data['rows'], page_num, self.pdf_path.name
+                table_data.rows, page_num, self.pdf_path.name
             )
             # Update confidence to img2table level
             for product in extracted:
@@ -1944,7 +1939,7 @@ class AutoExtractor:
         First attempts to parse markdown tables, then falls back to regex
         extraction on the text content.
         """
-        if not PYMUPDF4LLM_AVAILABLE:
+        if not pdf_reader.PYMUPDF4LLM_AVAILABLE:
             return []
 
         markdown_text = reader.extract_text_pymupdf4llm(page_num)
@@ -1958,7 +1953,7 @@ class AutoExtractor:
         if md_tables:
             for table in md_tables:
                 # Convert string table to expected format
-                table_rows = [[{'text': cell, 'bbox': None} for cell in row] for row in table]
+                table_rows = [[TableCell(cell) for cell in row] for row in table]
                 extracted = extract_products_from_table(
                     table_rows, page_num, self.pdf_path.name
                 )
@@ -1971,7 +1966,8 @@ class AutoExtractor:
         # If no products from tables, try regex extraction
         if not products:
             # Convert markdown to lines for regex extraction
-            lines = [line.strip() for line in markdown_text.split('\n') if line.strip()]
+            # Same cleanup as PDFReader.get_page(): each line is stripped once
+            lines = list(filter(None, map(str.strip, markdown_text.splitlines())))
 
             # Create a synthetic PageContent for the fallback extractor
             page_content = PageContent(
@@ -2003,7 +1999,7 @@ class AutoExtractor:
 
         for table_data in tables:
             extracted = extract_products_from_table(
-                table_data['rows'], page_num, self.pdf_path.name
+                table_data.rows, page_num, self.pdf_path.name
             )
             # Update confidence to pdfplumber level
             for product in extracted:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import Optional
 
@@ -9,7 +10,7 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 
-from .data_model import ExtractionSession
+from .data_model import ExtractionSession, find_session_file
 from .extractor import InteractiveExtractor
 from .auto_extractor import AutoExtractor
 from .verifier import Verifier
@@ -61,6 +62,19 @@ SESSIONS_DIR = PROCESSED_DIR / "sessions"
 EXTRACTIONS_DIR = PROCESSED_DIR / "extractions"
 
 
+@app.callback()
+def configure_logging() -> None:
+    # Extraction warnings from the library go through logging; print them to
+    # stderr in the same "Warning: ..." form they had as plain prints
+    package_logger = logging.getLogger("extractor")
+    if not package_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("Warning: %(message)s"))
+        package_logger.addHandler(handler)
+        package_logger.setLevel(logging.WARNING)
+        package_logger.propagate = False
+
+
 def ensure_directories() -> None:
     """Ensure required directories exist."""
     PROCESSED_DIR.mkdir(exist_ok=True)
@@ -140,11 +154,11 @@ def resume(
     ensure_directories()
 
     # Find the session file
-    session_path = SESSIONS_DIR / f"{catalog_name}.session.json"
+    session_path = find_session_file(SESSIONS_DIR, catalog_name)
 
-    if not session_path.exists():
+    if session_path is None:
         console.print(f"[red]No session found for:[/red] {catalog_name}")
-        console.print(f"[dim]Looking for: {session_path}[/dim]")
+        console.print(f"[dim]Looking for: {SESSIONS_DIR / catalog_name}.session.(json|msgpack)[/dim]")
         raise typer.Exit(1)
 
     session = ExtractionSession.load(session_path)
@@ -199,9 +213,9 @@ def export(
     """Export extracted data to CSV."""
     ensure_directories()
 
-    session_path = SESSIONS_DIR / f"{catalog_name}.session.json"
+    session_path = find_session_file(SESSIONS_DIR, catalog_name)
 
-    if not session_path.exists():
+    if session_path is None:
         console.print(f"[red]No session found for:[/red] {catalog_name}")
         raise typer.Exit(1)
 
@@ -309,9 +323,9 @@ def verify(
     """Verify and correct extracted data page-by-page."""
     ensure_directories()
 
-    session_path = SESSIONS_DIR / f"{catalog_name}.session.json"
+    session_path = find_session_file(SESSIONS_DIR, catalog_name)
 
-    if not session_path.exists():
+    if session_path is None:
         console.print(f"[red]No session found for:[/red] {catalog_name}")
         console.print("[dim]Run 'extractor auto <pdf>' first to extract data[/dim]")
         raise typer.Exit(1)
@@ -410,9 +424,9 @@ def web_verify(
         return
 
     # Catalog-specific mode
-    session_path = SESSIONS_DIR / f"{catalog_name}.session.json"
+    session_path = find_session_file(SESSIONS_DIR, catalog_name)
 
-    if not session_path.exists():
+    if session_path is None:
         console.print(f"[red]No session found for:[/red] {catalog_name}")
         console.print("[dim]Run 'extractor auto <pdf>' first to extract data[/dim]")
         raise typer.Exit(1)
@@ -1,21 +1,89 @@
 """Data models for catalog product extraction."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Optional
 import json
+import mmap
 import os
 import sys
 import tempfile
 import uuid
 from pathlib import Path
 
+# msgspec is optional - compact MessagePack session files
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
-def _generate_id() -> str:
-    """Generate a unique product ID."""
-    return str(uuid.uuid4())[:16]
+if MSGSPEC_AVAILABLE:
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder(dict)
+    _SESSION_DECODE_ERRORS = (json.JSONDecodeError, KeyError, msgspec.DecodeError)
+else:
+    _SESSION_DECODE_ERRORS = (json.JSONDecodeError, KeyError)
+
+
+# Session files at least this large are memory-mapped on load instead of copied
+MMAP_THRESHOLD = 64 * 1024
+
+# Journal entries after which append_product() folds the journal into a full save
+JOURNAL_COMPACT_THRESHOLD = 500
+
+# Session snapshot suffixes by format. A session is kept in one format at a
+# time: save() removes the snapshot in the other format
+JSON_SESSION_SUFFIX = ".session.json"
+MSGPACK_SESSION_SUFFIX = ".session.msgpack"
+SESSION_SUFFIXES = (JSON_SESSION_SUFFIX, MSGPACK_SESSION_SUFFIX)
+
+# Journal suffixes by snapshot format - each format replays only its own
+_JOURNAL_SUFFIXES = {
+    JSON_SESSION_SUFFIX: ".session.jsonl",
+    MSGPACK_SESSION_SUFFIX: ".session.msgpack.jsonl",
+}
 
 
-@dataclass
+def _generate_id() -> str:
+    """Generate a unique product ID."""
+    return uuid.uuid4().hex[:16]
+
+
+def find_session_files(session_dir: Path) -> dict[str, Path]:
+    """Map each catalog stem in session_dir to its session snapshot, JSON or MessagePack.
+
+    If a stem has snapshots in both formats (left by a save interrupted
+    before the old one was removed), the most recently written one wins.
+    """
+    found: dict[str, Path] = {}
+    if not session_dir.exists():
+        return found
+    with os.scandir(session_dir) as entries:
+        for entry in entries:
+            suffix = next((s for s in SESSION_SUFFIXES if entry.name.endswith(s)), None)
+            if suffix is None or not entry.is_file():
+                continue
+            stem = entry.name[:-len(suffix)]
+            path = Path(entry.path)
+            current = found.get(stem)
+            if current is None or path.stat().st_mtime_ns > current.stat().st_mtime_ns:
+                found[stem] = path
+    return found
+
+
+def find_session_file(session_dir: Path, stem: str) -> Optional[Path]:
+    """Return the session snapshot for a catalog stem, or None if there is none.
+
+    Looks for both formats; see find_session_files() for which one wins.
+    """
+    candidates = [session_dir / (stem + suffix) for suffix in SESSION_SUFFIXES]
+    existing = [path for path in candidates if path.exists()]
+    if not existing:
+        return None
+    return max(existing, key=lambda path: path.stat().st_mtime_ns)
+
+
+@dataclass(slots=True)
 class FieldLocation:
     """Represents the location of a field value on a PDF page."""
 
@@ -37,20 +105,19 @@ class FieldLocation:
             'confidence': self.confidence,
         }
 
+    # from_dict() is generated after the class body, see _compile_from_dict()
+
+    def to_tuple(self) -> tuple:
+        """Convert to a compact (x0, y0, x1, y1, page_number, confidence) tuple."""
+        return (self.x0, self.y0, self.x1, self.y1, self.page_number, self.confidence)
+
     @classmethod
-    def from_dict(cls, data: dict) -> "FieldLocation":
-        """Create from dictionary."""
-        return cls(
-            x0=data.get('x0', 0),
-            y0=data.get('y0', 0),
-            x1=data.get('x1', 0),
-            y1=data.get('y1', 0),
-            page_number=data.get('page_number', 0),
-            confidence=data.get('confidence', 1.0),
-        )
+    def from_tuple(cls, data: tuple | list) -> "FieldLocation":
+        """Create from a tuple/list produced by to_tuple()."""
+        return cls(*data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """Represents an extracted product from a catalog."""
 
@@ -64,22 +131,32 @@ class Product:
     id: str = field(default_factory=_generate_id)
     field_locations: dict[str, FieldLocation] = field(default_factory=dict)
 
-    def to_dict(self) -> dict:
-        """Convert product to dictionary."""
-        result = {
-            'product_name': self.product_name,
-            'description': self.description,
-            'item_no': self.item_no,
-            'pkg': self.pkg,
-            'uom': self.uom,
-            'page_number': self.page_number,
-            'source_file': self.source_file,
-            'id': self.id,
-        }
+    def __post_init__(self) -> None:
+        # These values repeat across most products in a session - share one copy
+        if type(self.source_file) is str:
+            self.source_file = sys.intern(self.source_file)
+        if type(self.pkg) is str:
+            self.pkg = sys.intern(self.pkg)
+        if type(self.uom) is str:
+            self.uom = sys.intern(self.uom)
+
+    def to_dict(self, compact: bool = False) -> dict:
+        """Convert product to dictionary.
+
+        With compact=True, field locations are stored as 6-tuples
+        (see FieldLocation.to_tuple) instead of dicts.
+        """
+        # All scalar fields are str/int, so no deepcopy (as asdict() would do)
+        result = {name: getattr(self, name) for name in _PRODUCT_FIELDS}
         if self.field_locations:
-            result['field_locations'] = {
-                k: v.to_dict() for k, v in self.field_locations.items()
-            }
+            if compact:
+                result['field_locations'] = {
+                    k: v.to_tuple() for k, v in self.field_locations.items()
+                }
+            else:
+                result['field_locations'] = {
+                    k: v.to_dict() for k, v in self.field_locations.items()
+                }
         return result
 
     def get_confidence_score(self) -> float:
@@ -92,36 +169,83 @@ class Product:
         confidences = [loc.confidence for loc in self.field_locations.values()]
         return (sum(confidences) / len(confidences)) * 100
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "Product":
-        """Create product from dictionary.
+    # from_dict() is generated after the class body, see _compile_from_dict()
+
+
+# Scalar Product fields, computed once instead of on every to_dict/from_dict call
+_PRODUCT_FIELDS = tuple(
+    f.name for f in fields(Product) if f.name != 'field_locations'
+)
+# (name, default) pairs used by from_dict; 'id' and 'field_locations' are handled separately
+_PRODUCT_DEFAULTS = tuple(
+    (f.name, f.default if isinstance(f.default, (str, int)) else "")
+    for f in fields(Product)
+    if f.name not in ('id', 'field_locations')
+)
+_FIELD_LOCATION_DEFAULTS = (
+    ('x0', 0), ('y0', 0), ('x1', 0), ('y1', 0), ('page_number', 0), ('confidence', 1.0),
+)
+
+
+def _compile_from_dict(
+    defaults: tuple,
+    extra_args: str = "",
+    namespace: Optional[dict] = None,
+    optional: Optional[tuple[str, str]] = None,
+):
+    """Generate a ``from_dict(cls, d)`` function with every ``d.get`` inlined.
+
+    Same idea as the __init__ that dataclasses generates: a single specialised
+    constructor call instead of a loop over field names at load time.
+    ``optional`` is a (field name, converter name) pair that is only passed to
+    the constructor when present and non-empty, so its default_factory is used
+    otherwise.
+    """
+    args = ", ".join(f"{name}=d.get({name!r}, {default!r})" for name, default in defaults)
+    args += extra_args
+    if optional:
+        name, converter = optional
+        source = (
+            "def from_dict(cls, d):\n"
+            f"    value = d.get({name!r})\n"
+            "    if value:\n"
+            f"        return cls({args}, {name}={converter}(value))\n"
+            f"    return cls({args})\n"
+        )
+    else:
+        source = f"def from_dict(cls, d):\n    return cls({args})\n"
+    ns = dict(namespace or {})
+    exec(source, ns)
+    return ns["from_dict"]
 
-        Only uses known fields, ignoring any extra keys in data.
-        """
-        field_locations = {}
-        if 'field_locations' in data and data['field_locations']:
-            for field_name, loc_data in data['field_locations'].items():
-                field_locations[field_name] = FieldLocation.from_dict(loc_data)
 
-        # Handle ID: generate new one if missing (None) or empty string
-        # Empty string IDs would make products unfindable, so treat them as missing
-        existing_id = data.get("id")
-        product_id = existing_id if existing_id else _generate_id()
+def _field_locations_from_dict(data: dict) -> dict[str, FieldLocation]:
+    """Rebuild field_locations from dict or compact tuple entries."""
+    return {
+        name: FieldLocation.from_dict(loc) if isinstance(loc, dict) else FieldLocation.from_tuple(loc)
+        for name, loc in data.items()
+    }
 
-        return cls(
-            product_name=data.get("product_name", ""),
-            description=data.get("description", ""),
-            item_no=data.get("item_no", ""),
-            pkg=data.get("pkg", ""),
-            uom=data.get("uom", ""),
-            page_number=data.get("page_number", 0),
-            source_file=data.get("source_file", ""),
-            id=product_id,
-            field_locations=field_locations,
-        )
 
+_field_location_from_dict = _compile_from_dict(_FIELD_LOCATION_DEFAULTS)
+_field_location_from_dict.__doc__ = "Create from dictionary."
+FieldLocation.from_dict = classmethod(_field_location_from_dict)
+
+# Missing or empty IDs get a fresh one - empty IDs would make products unfindable
+_product_from_dict = _compile_from_dict(
+    _PRODUCT_DEFAULTS,
+    ", id=d.get('id') or _generate_id()",
+    {'_generate_id': _generate_id, '_field_locations_from_dict': _field_locations_from_dict},
+    optional=('field_locations', '_field_locations_from_dict'),
+)
+_product_from_dict.__doc__ = """Create product from dictionary.
 
-@dataclass
+Only uses known fields, ignoring any extra keys in data.
+"""
+Product.from_dict = classmethod(_product_from_dict)
+
+
+@dataclass(slots=True)
 class ExtractionSession:
     """Tracks the state of an extraction session."""
 
@@ -130,18 +254,76 @@ class ExtractionSession:
     current_page: int = 1
     products: list[Product] = field(default_factory=list)
     completed: bool = False
+    # File stem of source_file, used to name session/journal/CSV files
+    stem: str = field(init=False, repr=False, compare=False)
+    _journal_entries: int = field(default=0, init=False, repr=False, compare=False)
+    # Format of the last snapshot loaded or saved; journal compaction keeps to it
+    _binary: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.stem = Path(self.source_file).stem
 
     def add_product(self, product: Product) -> None:
         """Add a product to the session."""
         self.products.append(product)
 
-    def to_dict(self) -> dict:
-        """Convert session to dictionary."""
+    def append_product(self, product: Product, session_dir: Path) -> Path:
+        """Add a product and append it to the session journal.
+
+        Writes a single JSON line to the session journal (synchronously, so
+        it survives a crash) instead of rewriting the whole session. The
+        journal is replayed by load() and cleared by the next save(); once it
+        exceeds JOURNAL_COMPACT_THRESHOLD entries a full save is done here.
+        """
+        self.add_product(product)
+        return self._append_journal([product.to_dict()], session_dir)
+
+    def append_page(self, products: list[Product], next_page: int, session_dir: Path) -> Path:
+        """Add a page's products and advance current_page, journaling both.
+
+        The products and a ``{"current_page": n}`` record go out in a single
+        write, so a session resumed after a crash neither loses the page's
+        products nor offers the page again (which would duplicate them under
+        new ids).
+        """
+        for product in products:
+            self.add_product(product)
+        self.current_page = next_page
+        records = [p.to_dict() for p in products]
+        records.append({"current_page": next_page})
+        return self._append_journal(records, session_dir)
+
+    def _append_journal(self, records: list[dict], session_dir: Path) -> Path:
+        """Append JSON lines to the session journal, compacting it when it grows too long."""
+        session_dir.mkdir(parents=True, exist_ok=True)
+        journal_path = self._journal_path(session_dir)
+        data = "".join(json.dumps(record) + "\n" for record in records).encode("utf-8")
+        # O_DSYNC makes each record durable on write without a separate fsync
+        # (not available on Windows, where the flag is skipped)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_DSYNC', 0)
+        fd = os.open(journal_path, flags, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+        self._journal_entries += len(records)
+        if self._journal_entries >= JOURNAL_COMPACT_THRESHOLD:
+            self.save(session_dir)
+        return journal_path
+
+    def _journal_path(self, session_dir: Path) -> Path:
+        """Journal belonging to the session's current snapshot format."""
+        suffix = MSGPACK_SESSION_SUFFIX if self._binary else JSON_SESSION_SUFFIX
+        return session_dir / (self.stem + _JOURNAL_SUFFIXES[suffix])
+
+    def to_dict(self, compact: bool = False) -> dict:
+        """Convert session to dictionary (compact: see Product.to_dict)."""
         return {
             "source_file": self.source_file,
             "total_pages": self.total_pages,
             "current_page": self.current_page,
-            "products": [p.to_dict() for p in self.products],
+            "products": [p.to_dict(compact) for p in self.products],
             "completed": self.completed,
         }
 
@@ -166,21 +348,58 @@ class ExtractionSession:
             completed=data.get("completed", False),
         )
 
-    def save(self, session_dir: Path) -> Path:
-        """Save session to JSON file atomically.
+    def to_msgpack(self) -> bytes:
+        """Encode session as MessagePack (requires msgspec)."""
+        if not MSGSPEC_AVAILABLE:
+            raise RuntimeError("msgspec is required for MessagePack sessions")
+        return _MSGPACK_ENCODER.encode(self.to_dict(compact=True))
+
+    @classmethod
+    def from_msgpack(cls, data: bytes | memoryview | mmap.mmap) -> "ExtractionSession":
+        """Decode session from a MessagePack buffer (requires msgspec)."""
+        if not MSGSPEC_AVAILABLE:
+            raise RuntimeError("msgspec is required for MessagePack sessions")
+        return cls.from_dict(_MSGPACK_DECODER.decode(data))
+
+    def save(self, session_dir: Path, binary: Optional[bool] = None, pretty: bool = False) -> Path:
+        """Save session to file atomically.
 
         Writes to a temporary file first, then atomically renames to prevent
-        data corruption if the process crashes during write.
+        data corruption if the process crashes during write. The snapshot in
+        the other format and both journals are removed afterwards, since the
+        new snapshot supersedes them.
+
+        Args:
+            session_dir: Directory for session files
+            binary: Write compact MessagePack (.session.msgpack) instead of
+                JSON (.session.json). Requires msgspec. Default: keep the
+                format the session was loaded or last saved in (JSON for a
+                new session).
+            pretty: Indent the JSON for reading by hand (slower, ~2x larger)
         """
+        if binary is None:
+            binary = self._binary
         session_dir.mkdir(parents=True, exist_ok=True)
-        filename = Path(self.source_file).stem + ".session.json"
-        session_path = session_dir / filename
+        suffix = MSGPACK_SESSION_SUFFIX if binary else JSON_SESSION_SUFFIX
+        other_suffix = JSON_SESSION_SUFFIX if binary else MSGPACK_SESSION_SUFFIX
+        session_path = session_dir / (self.stem + suffix)
+
+        # Encode before creating the temp file so a missing msgspec leaves nothing behind
+        payload = self.to_msgpack() if binary else None
 
         # Write to temp file in same directory, then atomic rename
         fd, temp_path = tempfile.mkstemp(dir=session_dir, suffix='.tmp')
         try:
-            with os.fdopen(fd, 'w') as f:
-                json.dump(self.to_dict(), f, indent=2)
+            if payload is not None:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+            else:
+                with os.fdopen(fd, 'w') as f:
+                    if pretty:
+                        json.dump(self.to_dict(), f, indent=2)
+                    else:
+                        # One-shot dumps() stays on the C encoder fast path
+                        f.write(json.dumps(self.to_dict(), separators=(',', ':')))
             # Atomic rename - os.replace works on POSIX; on Windows it may fail
             # if destination has certain attributes, so we handle that case
             try:
@@ -190,6 +409,13 @@ class ExtractionSession:
                 if session_path.exists():
                     session_path.unlink()
                 os.rename(temp_path, session_path)
+            # The new snapshot replaces the other format's and contains every
+            # journaled record; stale files would otherwise replay old state
+            (session_dir / (self.stem + other_suffix)).unlink(missing_ok=True)
+            for journal_suffix in _JOURNAL_SUFFIXES.values():
+                (session_dir / (self.stem + journal_suffix)).unlink(missing_ok=True)
+            self._journal_entries = 0
+            self._binary = binary
         except Exception:
             # Clean up temp file on failure
             try:
@@ -202,24 +428,75 @@ class ExtractionSession:
         return session_path
 
     @classmethod
-    def load(cls, session_path: Path) -> Optional["ExtractionSession"]:
-        """Load session from JSON file.
+    def load(cls, session_path: str | Path) -> Optional["ExtractionSession"]:
+        """Load session from a JSON or MessagePack (.msgpack) file.
 
         Returns None if file doesn't exist or is corrupted/invalid.
         """
+        session_path = Path(session_path)
         if not session_path.exists():
             return None
         try:
-            with open(session_path) as f:
-                data = json.load(f)
-            return cls.from_dict(data)
-        except (json.JSONDecodeError, KeyError) as e:
+            with open(session_path, 'rb') as f:
+                if session_path.suffix != '.msgpack':
+                    session = cls.from_dict(json.loads(f.read()))
+                elif os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    # msgspec decodes straight from the mapping - no read() copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        session = cls.from_msgpack(mm)
+                else:
+                    session = cls.from_msgpack(f.read())
+        except _SESSION_DECODE_ERRORS as e:
             # Log error but return None to allow graceful handling
             print(f"Warning: Failed to load session {session_path}: {e}", file=sys.stderr)
             return None
 
+        session._binary = session_path.suffix == '.msgpack'
+        session._replay_journal(session._journal_path(session_path.parent))
+        return session
+
+    def _replay_journal(self, journal_path: Path) -> None:
+        """Apply products and page positions appended to the journal since the last snapshot."""
+        if not journal_path.exists():
+            return
+
+        known_ids = {p.id for p in self.products}
+        with open(journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final record from a crash mid-append
+                    continue
+                if "current_page" in data:
+                    # Page position written by append_page()
+                    self.current_page = data["current_page"]
+                    self._journal_entries += 1
+                    continue
+                product = Product.from_dict(data)
+                if product.id not in known_ids:
+                    known_ids.add(product.id)
+                    self.products.append(product)
+                    self._journal_entries += 1
+
+
+@dataclass(slots=True, frozen=True)
+class TableCell:
+    """A table cell extracted from a PDF page."""
+
+    text: str
+    bbox: Optional[tuple] = None  # (x0, y0, x1, y1), if the backend provides it
+
+
+@dataclass(slots=True)
+class ExtractedTable:
+    """A table extracted from a PDF page, as rows of cells."""
+
+    bbox: Optional[tuple] = None  # Bounding box of the entire table
+    rows: list[list[TableCell]] = field(default_factory=list)
+
 
-@dataclass
+@dataclass(slots=True)
 class PageContent:
     """Represents extracted content from a PDF page."""
 
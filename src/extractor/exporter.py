@@ -1,13 +1,14 @@
 """CSV export functionality for extracted catalog data."""
 
+import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-import pandas as pd
 from rich.console import Console
 from rich.table import Table
 
-from .data_model import ExtractionSession
+from .data_model import ExtractionSession, find_session_files
 
 console = Console()
 
@@ -33,25 +34,22 @@ def export_to_csv(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     if filename is None:
-        filename = Path(session.source_file).stem + ".csv"
+        filename = session.stem + ".csv"
 
     output_path = output_dir / filename
 
-    # Convert products to DataFrame with proper column handling
-    data = []
-    for product in session.products:
-        product_dict = product.to_dict()
-        # Ensure all CSV columns are present with empty string defaults
-        row = {col: product_dict.get(col, '') for col in CSV_COLUMNS}
-        data.append(row)
-
-    df = pd.DataFrame(data, columns=CSV_COLUMNS)
-
-    # Replace any NaN values with empty strings for cleaner CSV output
-    df = df.fillna('')
-
-    # Export to CSV
-    df.to_csv(output_path, index=False)
+    # Stream rows straight to disk - a plain column projection needs no DataFrame
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        # pandas wrote '\n' line endings; csv defaults to '\r\n'
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(CSV_COLUMNS)
+        for product in session.products:
+            # Replace missing/None values with empty strings for cleaner CSV output
+            row = []
+            for col in CSV_COLUMNS:
+                value = getattr(product, col, '')
+                row.append('' if value is None else value)
+            writer.writerow(row)
 
     console.print(f"[green]Exported {len(session.products)} products to:[/green] {output_path}")
 
@@ -107,10 +105,17 @@ def list_sessions(session_dir: Path) -> list[ExtractionSession]:
     if not session_dir.exists():
         return sessions
 
-    for session_file in session_dir.glob("*.session.json"):
-        session = ExtractionSession.load(session_file)
-        if session:
-            sessions.append(session)
+    # One snapshot per catalog, JSON or MessagePack; sorted so the result
+    # order doesn't depend on thread scheduling
+    session_files = [path for _, path in sorted(find_session_files(session_dir).items())]
+    if not session_files:
+        return sessions
+
+    # Loading is dominated by file I/O, so overlap reads across threads
+    with ThreadPoolExecutor(max_workers=min(16, len(session_files))) as executor:
+        for session in executor.map(ExtractionSession.load, session_files):
+            if session:
+                sessions.append(session)
 
     return sessions
 
@@ -137,7 +142,7 @@ def display_status(session_dir: Path, extractions_dir: Path) -> None:
         progress = f"{session.current_page}/{session.total_pages}"
         status = "[green]Completed[/green]" if session.completed else "[yellow]In Progress[/yellow]"
 
-        csv_path = extractions_dir / (Path(session.source_file).stem + ".csv")
+        csv_path = extractions_dir / (session.stem + ".csv")
         csv_status = "[green]Yes[/green]" if csv_path.exists() else "[dim]No[/dim]"
 
         table.add_row(
@@ -1,5 +1,6 @@
 """Semi-automatic extraction workflow for catalog data."""
 
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -9,28 +10,35 @@ from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.text import Text
 
-from .data_model import Product, ExtractionSession, PageContent
+from .data_model import Product, ExtractionSession, PageContent, find_session_file
 from .pdf_reader import PDFReader
 
 console = Console()
 
+# One comma-separated selection item: a line number ("3") or a range ("1-5")
+LINE_SELECTION_PATTERN = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+)\s*)?')
+
 
 class InteractiveExtractor:
     """Handles the semi-automatic extraction workflow."""
 
+    # Persist the session every N extracted pages (always flushed on quit/completion)
+    SAVE_EVERY = 5
+
     def __init__(self, pdf_path: Path, session_dir: Path):
         self.pdf_path = Path(pdf_path)
         self.session_dir = session_dir
         self.session: Optional[ExtractionSession] = None
+        self._pages_since_save = 0
 
-    def _get_session_path(self) -> Path:
-        """Get the session file path for this PDF."""
-        return self.session_dir / (self.pdf_path.stem + ".session.json")
+    def _get_session_path(self) -> Optional[Path]:
+        """Get the session file path for this PDF (JSON or MessagePack), if one exists."""
+        return find_session_file(self.session_dir, self.pdf_path.stem)
 
     def load_or_create_session(self, total_pages: int) -> ExtractionSession:
         """Load existing session or create a new one."""
         session_path = self._get_session_path()
-        session = ExtractionSession.load(session_path)
+        session = ExtractionSession.load(session_path) if session_path else None
 
         if session:
             console.print(
@@ -39,16 +47,20 @@ class InteractiveExtractor:
             )
             return session
 
-        return ExtractionSession(
+        session = ExtractionSession(
             source_file=self.pdf_path.name,
             total_pages=total_pages,
             current_page=1,
         )
+        # Write an initial snapshot so journaled products can be recovered
+        session.save(self.session_dir)
+        return session
 
     def save_session(self) -> None:
         """Save current session to disk."""
         if self.session:
             self.session.save(self.session_dir)
+            self._pages_since_save = 0
 
     def display_page(self, page: PageContent) -> None:
         """Display page content with line numbers."""
@@ -79,27 +91,23 @@ class InteractiveExtractor:
 
         # Parse line selection
         selected_lines = []
+        num_lines = len(page.lines)
         for part in selection.split(","):
-            part = part.strip()
-            if "-" in part:
-                try:
-                    parts = part.split("-")
-                    if len(parts) != 2:
-                        console.print(f"[red]Invalid range format: {part} (use start-end)[/red]")
-                        continue
-                    start, end = parts
-                    for i in range(int(start), int(end) + 1):
-                        if 1 <= i <= len(page.lines):
-                            selected_lines.append(page.lines[i - 1])
-                except ValueError:
+            match = LINE_SELECTION_PATTERN.fullmatch(part)
+            if not match:
+                part = part.strip()
+                if part.count("-") > 1:
+                    console.print(f"[red]Invalid range format: {part} (use start-end)[/red]")
+                elif "-" in part:
                     console.print(f"[red]Invalid range: {part}[/red]")
-            else:
-                try:
-                    line_num = int(part)
-                    if 1 <= line_num <= len(page.lines):
-                        selected_lines.append(page.lines[line_num - 1])
-                except ValueError:
+                else:
                     console.print(f"[red]Invalid line number: {part}[/red]")
+                continue
+
+            start = int(match[1])
+            end = int(match[2]) if match[2] else start
+            # Lines are 1-indexed; out-of-range numbers are ignored
+            selected_lines.extend(page.lines[max(start, 1) - 1:min(end, num_lines)])
 
         return selected_lines
 
@@ -157,12 +165,21 @@ class InteractiveExtractor:
 
         console.print(table)
 
-    def extract_from_page(self, page: PageContent) -> list[Product]:
-        """Extract products from a single page interactively."""
+    def extract_from_page(self, page: PageContent, already_displayed: bool = False) -> list[Product]:
+        """Extract products from a single page interactively.
+
+        Args:
+            page: Page to extract from
+            already_displayed: Skip the initial page render when the caller
+                has just shown it (the page is re-rendered for each further product)
+        """
         products = []
+        show_page = not already_displayed
 
         while True:
-            self.display_page(page)
+            if show_page:
+                self.display_page(page)
+            show_page = True
 
             selected_lines = self.prompt_line_selection(page)
             if not selected_lines:
@@ -229,13 +246,15 @@ class InteractiveExtractor:
                     continue
 
                 elif action == "extract":
-                    # Hide the page display we just showed and re-run extraction
-                    products = self.extract_from_page(page)
-                    for product in products:
-                        self.session.add_product(product)
-
-                    # Auto-save after each page
-                    self.save_session()
+                    # Page was displayed above - don't render it a second time
+                    products = self.extract_from_page(page, already_displayed=True)
+                    # Journals the products together with the next page to resume from
+                    self.session.append_page(products, page_num + 1, self.session_dir)
+
+                    # Auto-save periodically - a full save rewrites the whole session
+                    self._pages_since_save += 1
+                    if self._pages_since_save >= self.SAVE_EVERY:
+                        self.save_session()
                     page_num += 1
 
             # Mark as completed if we reached the end
@@ -1,71 +1,220 @@
 """PDF text extraction using pdfplumber, camelot, and pdfminer.six."""
 
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import cache, wraps
+import importlib.util
+import io
 from itertools import zip_longest
+import logging
+import math
+import multiprocessing
+import os
 from pathlib import Path
-import sys
+import queue
+import re
+import shutil
+from sys import intern
+import tempfile
 import threading
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Literal, Optional
 
 import pdfplumber
+from pdfminer.converter import PDFPageAggregator, TextConverter
 from pdfminer.high_level import extract_pages
-from pdfminer.layout import LAParams, LTTextBoxHorizontal, LTTextLineHorizontal
-
-from .data_model import PageContent
+from pdfminer.layout import LAParams, LTPage, LTTextBoxHorizontal, LTTextLineHorizontal
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
+
+from .data_model import ExtractedTable, PageContent, TableCell
+
+logger = logging.getLogger(__name__)
+
+# Layout analysis settings for extract_text_with_layout(), shared by all calls
+_DEFAULT_LAPARAMS = LAParams(
+    line_margin=0.3,       # Tighter line grouping for better row detection
+    word_margin=0.15,      # Closer word grouping for column separation
+    char_margin=2.0,
+    boxes_flow=0.7,        # Stronger column separation for multi-column layouts
+    detect_vertical=True,  # Enable vertical text detection
+)
+
+# pdfminer's own defaults, used by the 'pdfminer' get_page() text backend
+_TEXT_LAPARAMS = LAParams()
+
+# Last-resort regex parsing of table HTML, when no HTML parser accepts it
+_HTML_ROW_PATTERN = re.compile(r'<tr[^>]*>(.*?)</tr>', re.DOTALL | re.IGNORECASE)
+_HTML_CELL_PATTERN = re.compile(r'<t[dh][^>]*>(.*?)</t[dh]>', re.DOTALL | re.IGNORECASE)
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# iter_pages_auto() strategy by number of pages to read:
+# (max pages, mode, options) - the first rule that fits is used
+_ITER_PAGES_RULES: list[tuple[float, str, dict]] = [
+    (10, "serial", {}),
+    (200, "prefetch", {"prefetch": 2}),
+    (1000, "process", {"chunk_size": 200}),
+    (float("inf"), "process", {"chunk_size": 500}),
+]
+
+# extract_tables_smart() backends by classify_pdf() result ('scanned' or the
+# layout_type), cheapest first - later ones only run if earlier ones find nothing
+_SMART_TABLE_RULES: dict[str, tuple[str, ...]] = {
+    "scanned": ("img2table", "docling", "unstructured"),
+    "tabular": ("pdfplumber", "pymupdf", "camelot", "docling"),
+    "borderless": ("img2table", "pdfplumber", "pymupdf", "docling"),
+    "text-only": ("pdfplumber",),
+    "mixed": ("pdfplumber", "pymupdf", "img2table", "camelot", "docling", "unstructured"),
+}
 
 
 class ExtractionWarning:
     """Tracks extraction warnings for diagnostic purposes.
 
-    Thread-safe implementation using a lock for concurrent access.
+    Thread-safe without a lock: deque.append() and copying a deque of
+    strings are single C-level operations under the GIL. Only the most
+    recent MAX_WARNINGS messages are kept.
     """
-    _warnings: list[str] = []
-    _lock = threading.Lock()
+    MAX_WARNINGS = 10000
+    _warnings: deque[str] = deque(maxlen=MAX_WARNINGS)
 
     @classmethod
     def add(cls, message: str):
         """Add a warning message (thread-safe)."""
-        with cls._lock:
-            cls._warnings.append(message)
+        cls._warnings.append(message)
 
     @classmethod
     def get_all(cls) -> list[str]:
         """Get all warning messages (thread-safe)."""
-        with cls._lock:
-            return cls._warnings.copy()
+        return list(cls._warnings)
 
     @classmethod
     def clear(cls):
         """Clear all warnings (thread-safe)."""
-        with cls._lock:
-            cls._warnings.clear()
+        cls._warnings.clear()
+
+
+# Heavy optional backends (Camelot, Docling, img2table, pymupdf4llm, unstructured)
+# are only located at import time and imported on first use - Docling loads
+# PyTorch and pymupdf4llm its layout model, which would otherwise slow down
+# every import of this module.
+def _module_available(name: str) -> bool:
+    """Check whether a module is installed, without importing it.
+
+    For a dotted name only the parent packages are imported, not the module.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # A parent package of a dotted name is missing
+        return False
+
+
+def _optional_import(name: str, flag: str):
+    """Make a function the cached import accessor of an optional backend.
+
+    Being installed doesn't guarantee a package imports (missing extras or
+    system libraries). The first failed import sets the module-level `flag`
+    (e.g. "CAMELOT_AVAILABLE") to False, so backend selection skips it from
+    then on, and the ImportError is kept and re-raised instead of retrying
+    the import on every call.
+
+    Args:
+        name: Backend name for the warning logged on failure
+        flag: Name of the module-level availability flag to clear
+    """
+    def decorator(loader):
+        @cache
+        def load():
+            try:
+                return loader(), None
+            except ImportError as e:
+                globals()[flag] = False
+                warning_msg = f"{name} is installed but failed to import, disabling it: {e}"
+                logger.warning(warning_msg)
+                ExtractionWarning.add(warning_msg)
+                return None, e
+
+        @wraps(loader)
+        def accessor():
+            value, error = load()
+            if error is not None:
+                raise error.with_traceback(None)
+            return value
+        return accessor
+    return decorator
+
 
 # Camelot is optional - only imported when needed
-try:
+CAMELOT_AVAILABLE = _module_available("camelot")
+
+
+@_optional_import("Camelot", "CAMELOT_AVAILABLE")
+def _camelot():
     import camelot
-    CAMELOT_AVAILABLE = True
-except ImportError:
-    CAMELOT_AVAILABLE = False
+    return camelot
+
 
 # Docling is optional - AI-powered table extraction
-try:
+DOCLING_AVAILABLE = _module_available("docling")
+
+
+@_optional_import("Docling", "DOCLING_AVAILABLE")
+def _docling_document_stream():
+    from docling.datamodel.base_models import DocumentStream
+    return DocumentStream
+
+
+# Shared by all readers - creating a converter loads the TableFormer model weights
+_docling_converter = None
+_docling_converter_lock = threading.Lock()
+
+
+@_optional_import("Docling", "DOCLING_AVAILABLE")
+def _docling_converter_class():
     from docling.document_converter import DocumentConverter
-    DOCLING_AVAILABLE = True
-except ImportError:
-    DOCLING_AVAILABLE = False
+    return DocumentConverter
+
+
+def _get_docling_converter():
+    """Return the process-wide Docling DocumentConverter, creating it on first use."""
+    global _docling_converter
+    with _docling_converter_lock:
+        if _docling_converter is None:
+            _docling_converter = _docling_converter_class()()
+        return _docling_converter
+
+
+# Conversions of recently used files, keyed on (resolved path, mtime, size) so
+# readers opened one after another on the same unchanged PDF share the result.
+# Kept small since a conversion holds the whole parsed document.
+_DOCLING_CACHE_SIZE = 8
+_docling_results: OrderedDict[tuple[str, int, int], object] = OrderedDict()
+_docling_results_lock = threading.Lock()
+
 
 # img2table is optional - borderless table detection
-try:
-    from img2table.document import PDF as Img2TablePDF
-    IMG2TABLE_AVAILABLE = True
-except ImportError:
-    IMG2TABLE_AVAILABLE = False
+IMG2TABLE_AVAILABLE = _module_available("img2table")
+
+
+@_optional_import("img2table", "IMG2TABLE_AVAILABLE")
+def _img2table_pdf():
+    from img2table.document import PDF
+    return PDF
+
 
 # pymupdf4llm is optional - fast layout-aware markdown extraction
-try:
+PYMUPDF4LLM_AVAILABLE = _module_available("pymupdf4llm")
+
+
+@_optional_import("pymupdf4llm", "PYMUPDF4LLM_AVAILABLE")
+def _pymupdf4llm():
     import pymupdf4llm
-    PYMUPDF4LLM_AVAILABLE = True
-except ImportError:
-    PYMUPDF4LLM_AVAILABLE = False
+    return pymupdf4llm
+
 
 # PyMuPDF (fitz) - fast PDF library with table extraction
 try:
@@ -78,38 +227,290 @@ except ImportError:
     except ImportError:
         PYMUPDF_AVAILABLE = False
 
-# unstructured is optional - document understanding with layout analysis
+# MuPDF is not thread-safe, even across separate documents
+_pymupdf_lock = threading.Lock()
+
+# pypdfium2 is optional (normally installed with pdfplumber) - C++ text extraction
 try:
-    from unstructured.partition.pdf import partition_pdf
-    UNSTRUCTURED_AVAILABLE = True
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
 except ImportError:
-    UNSTRUCTURED_AVAILABLE = False
+    PDFIUM_AVAILABLE = False
+
+# PDFium is not thread-safe, even across separate documents
+_pdfium_lock = threading.Lock()
+
+# NumPy is optional - columnar output of extract_layout_bulk()
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# unstructured is optional - document understanding with layout analysis. Its
+# PDF partitioner needs the [pdf] extras, which only the first import checks
+UNSTRUCTURED_AVAILABLE = _module_available("unstructured.partition.pdf")
+
+# lxml is optional (installed with unstructured) - fast parsing of its table HTML
+LXML_AVAILABLE = _module_available("lxml")
+
+
+@_optional_import("lxml", "LXML_AVAILABLE")
+def _lxml_html():
+    import lxml.html
+    return lxml.html
+
+
+@_optional_import("unstructured", "UNSTRUCTURED_AVAILABLE")
+def _partition_pdf():
+    from unstructured.partition.pdf import partition_pdf
+    return partition_pdf
+
+
+def check_optional_backends() -> dict[str, bool]:
+    """Import each installed optional backend and report which ones work.
+
+    The *_AVAILABLE flags only say a package is installed until its first
+    use; this runs that first import now (Docling's takes several seconds),
+    clearing the flag of any backend that fails.
+    """
+    accessors = {
+        "camelot": ("CAMELOT_AVAILABLE", _camelot),
+        "docling": ("DOCLING_AVAILABLE", _docling_converter_class),
+        "img2table": ("IMG2TABLE_AVAILABLE", _img2table_pdf),
+        "pymupdf4llm": ("PYMUPDF4LLM_AVAILABLE", _pymupdf4llm),
+        "unstructured": ("UNSTRUCTURED_AVAILABLE", _partition_pdf),
+        "lxml": ("LXML_AVAILABLE", _lxml_html),
+    }
+    status = {}
+    for name, (flag, accessor) in accessors.items():
+        if globals()[flag]:
+            try:
+                accessor()
+            except ImportError:
+                pass  # Flag cleared and warning logged by the accessor
+        status[name] = globals()[flag]
+    return status
+
+
+# Cell texts up to this length are interned - headers, units, prices and
+# "N/A"-style values repeat across rows, so cached table results share one
+# string object per distinct value instead of holding a copy per cell
+_INTERN_MAX_LEN = 16
+
+
+def _intern_short(texts: list[str]) -> list[str]:
+    """Intern the short strings of a row of cleaned cell texts."""
+    return [intern(text) if len(text) <= _INTERN_MAX_LEN else text for text in texts]
+
+
+def _require_page(method):
+    """Check that the reader is open and page_number is in range before calling method."""
+    @wraps(method)
+    def wrapper(self, page_number: int, *args, **kwargs):
+        if not self._pdf:
+            raise RuntimeError("PDF not opened. Use context manager.")
+
+        total_pages = self.total_pages
+        if page_number < 1 or page_number > total_pages:
+            raise ValueError(f"Page {page_number} out of range (1-{total_pages})")
+
+        return method(self, page_number, *args, **kwargs)
+    return wrapper
+
+
+@dataclass(slots=True)
+class _CachedPage:
+    """Per-page entry of PDFReader's LRU cache."""
+    page: "pdfplumber.page.Page"
+    content: Optional[PageContent] = None  # get_page() result
+    found_tables: Optional[list] = None  # pdfplumber table detection
+    tables: Optional[list[list[list[str]]]] = None  # extract_tables() result
+    positioned_tables: Optional[list[ExtractedTable]] = None  # extract_tables_with_positions() result
 
 
 class PDFReader:
     """Handles PDF text extraction with positional data."""
 
-    def __init__(self, pdf_path: Path):
+    # Number of recently used pages whose parsed objects and results are kept in memory
+    PAGE_CACHE_SIZE = 64
+    # Of those, how many keep pdfplumber's parsed chars/objects; results outlive them
+    PARSED_PAGE_LIMIT = 4
+    # Smallest default batch for iter_pages_parallel(); smaller ones cost more in IPC than they save
+    MIN_PARALLEL_CHUNK = 10
+    # Files larger than this are parsed from disk rather than read into memory on open
+    MAX_BUFFERED_SIZE = 200 * 1024 * 1024
+
+    def __init__(
+        self,
+        pdf_path: Path,
+        text_backend: Literal["pdfplumber", "pdfminer", "pdfium", "pymupdf"] = "pdfplumber",
+    ):
+        if text_backend not in ("pdfplumber", "pdfminer", "pdfium", "pymupdf"):
+            raise ValueError(f"Unknown text backend: {text_backend}")
+        if text_backend == "pdfium" and not PDFIUM_AVAILABLE:
+            raise RuntimeError("pypdfium2 is required for the 'pdfium' text backend")
+        if text_backend == "pymupdf" and not PYMUPDF_AVAILABLE:
+            raise RuntimeError("PyMuPDF is required for the 'pymupdf' text backend")
         self.pdf_path = Path(pdf_path)
+        self._pdf_path_str = str(self.pdf_path)  # For backends that take a str path
+        # Library used by get_page(); 'pdfminer' skips pdfplumber's per-char objects,
+        # 'pdfium' and 'pymupdf' extract text in C/C++, for text-only use. Table and
+        # position methods always use pdfplumber.
+        self.text_backend = text_backend
         self._pdf: Optional[pdfplumber.PDF] = None
+        self._pdfium_doc = None  # pypdfium2 PdfDocument for the 'pdfium' backend
+        self._pymupdf_doc = None  # PyMuPDF Document over _pdf_bytes, opened on first use
+        self._pdf_bytes: Optional[bytes] = None  # File contents, read once on open (unless too large)
+        self._preloaded_bytes: Optional[bytes] = None  # Contents given to from_bytes()
+        self._total_pages: Optional[int] = None
+        # LRU of page number -> pdfplumber page and the results extracted from it
+        self._page_cache: OrderedDict[int, _CachedPage] = OrderedDict()
+        # Recently used page numbers whose pdfplumber objects haven't been flushed
+        self._parsed_pages: OrderedDict[int, None] = OrderedDict()
+        # (aggregator, interpreter) for _DEFAULT_LAPARAMS layout analysis
+        self._layout_interpreter: Optional[tuple[PDFPageAggregator, PDFPageInterpreter]] = None
+        self._camelot_page_files: dict[tuple[int, ...], str] = {}  # Page subsets for Camelot
+        # (page number, requested flavor) -> Camelot tables
+        self._camelot_tables: dict[tuple[int, Optional[str]], list[ExtractedTable]] = {}
+        self._camelot_tmpdir: Optional[str] = None
         self._docling_result = None  # Cache for Docling conversion (expensive)
         self._docling_lock = threading.Lock()  # Thread-safe cache access
+        self._unstructured_tables: Optional[dict[int, list[ExtractedTable]]] = None  # Tables by page
+        self._unstructured_lock = threading.Lock()
         self._pdf_classification: Optional[dict] = None  # Cache for PDF classification
+        self._smart_table_backend: Optional[str] = None  # Last backend that found tables
+
+    @classmethod
+    def from_bytes(cls, data: bytes, pdf_path: Path, **kwargs) -> "PDFReader":
+        """Create a reader over PDF contents that have already been read.
+
+        pdf_path names the document and is still used by Camelot without
+        PyMuPDF and by iter_pages_parallel() workers, so it should point at
+        the same file.
+        """
+        reader = cls(pdf_path, **kwargs)
+        reader._preloaded_bytes = data
+        return reader
 
     def __enter__(self) -> "PDFReader":
-        self._pdf = pdfplumber.open(self.pdf_path)
+        # Read the file once; pdfplumber and pdfminer then parse from memory
+        # instead of each re-opening the file. Very large files stay on disk.
+        if self._preloaded_bytes is not None:
+            self._pdf_bytes = self._preloaded_bytes
+        elif self.pdf_path.stat().st_size <= self.MAX_BUFFERED_SIZE:
+            self._pdf_bytes = self.pdf_path.read_bytes()
+        self._open_documents()
         return self
 
+    def _open_documents(self) -> None:
+        """Open the parsers used by this reader over self._pdf_bytes, or the file if not buffered."""
+        if self._pdf_bytes is not None:
+            self._pdf = pdfplumber.open(io.BytesIO(self._pdf_bytes))
+        else:
+            self._pdf = pdfplumber.open(self._pdf_path_str)
+        if self.text_backend == "pdfium":
+            with _pdfium_lock:
+                self._pdfium_doc = pdfium.PdfDocument(
+                    self._pdf_bytes if self._pdf_bytes is not None else self._pdf_path_str
+                )
+        elif self.text_backend == "pymupdf":
+            self._pymupdf_document()
+
+    def _pymupdf_document(self):
+        """Return a PyMuPDF Document over the open PDF, opening it on first use.
+
+        Returns None if the reader isn't open.
+        """
+        if self._pymupdf_doc is None and self._pdf:
+            with _pymupdf_lock:
+                if self._pdf_bytes is not None:
+                    self._pymupdf_doc = pymupdf.open(stream=self._pdf_bytes, filetype="pdf")
+                else:
+                    self._pymupdf_doc = pymupdf.open(self._pdf_path_str)
+        return self._pymupdf_doc
+
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.clear_page_cache()
+        self._layout_interpreter = None
+        self._total_pages = None
         if self._pdf:
             self._pdf.close()
+            self._pdf = None
+        if self._pdfium_doc is not None:
+            with _pdfium_lock:
+                self._pdfium_doc.close()
+            self._pdfium_doc = None
+        if self._pymupdf_doc is not None:
+            with _pymupdf_lock:
+                self._pymupdf_doc.close()
+            self._pymupdf_doc = None
+        self._pdf_bytes = None
+        if self._camelot_tmpdir:
+            shutil.rmtree(self._camelot_tmpdir, ignore_errors=True)
+            self._camelot_tmpdir = None
+            self._camelot_page_files.clear()
+
+    def _get_pdfplumber_page(self, page_number: int) -> "pdfplumber.page.Page":
+        """Return the pdfplumber page for a 1-indexed page number.
+
+        The caller is about to parse the page, so it counts towards
+        PARSED_PAGE_LIMIT; the least recently parsed page beyond that has its
+        chars/objects flushed so memory stays bounded.
+        """
+        entry = self._cached_page(page_number)
+        self._parsed_pages[page_number] = None
+        self._parsed_pages.move_to_end(page_number)
+        if len(self._parsed_pages) > self.PARSED_PAGE_LIMIT:
+            self.flush_page(next(iter(self._parsed_pages)))
+        return entry.page
+
+    def _cached_page(self, page_number: int) -> _CachedPage:
+        """Return the LRU cache entry for a page, creating it if needed."""
+        entry = self._page_cache.get(page_number)
+        if entry is not None:
+            self._page_cache.move_to_end(page_number)
+            return entry
+
+        entry = self._page_cache[page_number] = _CachedPage(self._pdf.pages[page_number - 1])
+        if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            evicted_number, evicted = self._page_cache.popitem(last=False)
+            evicted.page.close()
+            self._parsed_pages.pop(evicted_number, None)
+        return entry
+
+    def _tables_on_page(self, page_number: int) -> list:
+        """Return pdfplumber's detected tables for a page, cached with the page.
+
+        extract_tables(), extract_tables_with_positions() and classify_pdf()
+        all start from the same table detection, so it only runs once per page.
+        """
+        page = self._get_pdfplumber_page(page_number)
+        entry = self._page_cache[page_number]
+        if entry.found_tables is None:
+            # The default "lines" strategy only finds tables along drawn edges,
+            # so skip edge detection on pages with no vector graphics at all
+            if page.lines or page.rects or page.curves:
+                entry.found_tables = page.find_tables()
+            else:
+                entry.found_tables = []
+        return entry.found_tables
+
+    def clear_page_cache(self) -> None:
+        """Flush all cached page data (for long-running processes)."""
+        for entry in self._page_cache.values():
+            entry.page.close()
+        self._page_cache.clear()
+        self._parsed_pages.clear()
 
     @property
     def total_pages(self) -> int:
         """Return total number of pages in the PDF."""
         if not self._pdf:
             raise RuntimeError("PDF not opened. Use context manager.")
-        return len(self._pdf.pages)
+        if self._total_pages is None:
+            self._total_pages = len(self._pdf.pages)
+        return self._total_pages
 
     def classify_pdf(self, sample_pages: int = 3) -> dict:
         """Classify PDF for optimal extraction strategy.
@@ -139,14 +540,13 @@ class PDFReader:
         total_rects = 0  # PDF rectangles (table borders)
         total_images = 0
         pages_with_tables = 0
-        total_table_cells = 0
 
         for page_idx in range(pages_to_check):
-            page = self._pdf.pages[page_idx]
+            page = self._get_pdfplumber_page(page_idx + 1)
 
-            # Check for extractable text
-            text = page.extract_text() or ""
-            total_text_chars += len(text.strip())
+            # Check for extractable text; goes through get_page() so the
+            # extraction is cached and reused when the page is read later
+            total_text_chars += len(self.get_page(page_idx + 1).raw_text.strip())
 
             # Check for line objects (table borders)
             # pdfplumber exposes lines and rects for border detection
@@ -161,12 +561,9 @@ class PDFReader:
 
             # Try to find tables to assess table presence
             try:
-                tables = page.find_tables()
+                tables = self._tables_on_page(page_idx + 1)
                 if tables:
                     pages_with_tables += 1
-                    for table in tables:
-                        rows = table.extract()
-                        total_table_cells += sum(len(row) for row in rows if row)
             except Exception:
                 pass
 
@@ -235,19 +632,21 @@ class PDFReader:
         if not self._pdf:
             raise RuntimeError("PDF not opened. Use context manager.")
 
-        page = self._pdf.pages[page_number - 1]
+        page = self._get_pdfplumber_page(page_number)
 
         # Check for line objects (table borders)
         lines = page.lines or []
         rects = page.rects or []
 
-        # Count horizontal and vertical lines
+        # Count horizontal and vertical lines. Gathering the coordinates into
+        # NumPy arrays costs as much as these passes, so they stay in Python
         h_lines = sum(1 for l in lines if abs(l.get('top', 0) - l.get('bottom', 0)) < 2)
         v_lines = sum(1 for l in lines if abs(l.get('x0', 0) - l.get('x1', 0)) < 2)
 
         # A bordered table typically has multiple horizontal and vertical lines
         return (h_lines >= 3 and v_lines >= 2) or len(rects) >= 4
 
+    @_require_page
     def extract_words(self, page_number: int) -> list[dict]:
         """Extract individual words with positions from a page using pdfplumber.
 
@@ -259,13 +658,7 @@ class PDFReader:
         Returns:
             List of word dicts with position data
         """
-        if not self._pdf:
-            raise RuntimeError("PDF not opened. Use context manager.")
-
-        if page_number < 1 or page_number > self.total_pages:
-            raise ValueError(f"Page {page_number} out of range (1-{self.total_pages})")
-
-        page = self._pdf.pages[page_number - 1]
+        page = self._get_pdfplumber_page(page_number)
 
         try:
             words = page.extract_words(
@@ -284,10 +677,11 @@ class PDFReader:
             ]
         except Exception as e:
             warning_msg = f"Failed to extract words from page {page_number}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
+            logger.warning(warning_msg)
             ExtractionWarning.add(warning_msg)
             return []
 
+    @_require_page
     def get_page_dimensions(self, page_number: int) -> tuple[float, float]:
         """Get width and height of a page.
 
@@ -297,259 +691,632 @@ class PDFReader:
         Returns:
             (width, height) tuple
         """
-        if not self._pdf:
-            raise RuntimeError("PDF not opened. Use context manager.")
+        page = self._get_pdfplumber_page(page_number)
+        return (float(page.width), float(page.height))
 
-        if page_number < 1 or page_number > self.total_pages:
-            raise ValueError(f"Page {page_number} out of range (1-{self.total_pages})")
+    def _pdfium_text(self, page_number: int) -> str:
+        """Extract a page's text with PDFium."""
+        with _pdfium_lock:
+            page = self._pdfium_doc[page_number - 1]
+            textpage = page.get_textpage()
+            try:
+                return textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
 
-        page = self._pdf.pages[page_number - 1]
-        return (float(page.width), float(page.height))
+    def _pdfminer_text(self, page_number: int) -> str:
+        """Extract a page's text the way pdfminer's extract_text() does.
 
-    def get_page(self, page_number: int) -> PageContent:
+        Runs the same TextConverter over the page objects and resource
+        manager pdfplumber already parsed, instead of extract_text()
+        re-opening the PDF and re-parsing the xref for every page.
+        """
+        output = io.StringIO()
+        device = TextConverter(self._pdf.rsrcmgr, output, laparams=_TEXT_LAPARAMS)
+        # page_obj doesn't parse pdfplumber's chars, so use the entry directly
+        page_obj = self._cached_page(page_number).page.page_obj
+        PDFPageInterpreter(self._pdf.rsrcmgr, device).process_page(page_obj)
+        return output.getvalue()
+
+    def _pymupdf_text(self, page_number: int) -> str:
+        """Extract a page's text with PyMuPDF.
+
+        Blocks are sorted top-to-bottom/left-to-right so that table rows come
+        out as single lines, and the column padding this produces is collapsed
+        to single spaces to match pdfplumber's output.
+        """
+        with _pymupdf_lock:
+            text = self._pymupdf_doc[page_number - 1].get_text("text", sort=True)
+        return "\n".join(" ".join(line.split()) for line in text.splitlines())
+
+    @_require_page
+    def get_page(self, page_number: int, flush: bool = False) -> PageContent:
         """Extract content from a specific page (1-indexed).
 
         Returns empty PageContent if extraction fails (e.g., encrypted page).
+        With flush=True, pdfplumber's parsed objects for the page are released
+        afterwards (see flush_page()).
         """
-        if not self._pdf:
-            raise RuntimeError("PDF not opened. Use context manager.")
-
-        if page_number < 1 or page_number > self.total_pages:
-            raise ValueError(f"Page {page_number} out of range (1-{self.total_pages})")
-
-        page = self._pdf.pages[page_number - 1]
+        entry = self._cached_page(page_number)
+        if entry.content is not None:
+            return entry.content
 
         try:
-            raw_text = page.extract_text() or ""
+            if self.text_backend == "pdfium":
+                raw_text = self._pdfium_text(page_number)
+            elif self.text_backend == "pymupdf":
+                raw_text = self._pymupdf_text(page_number)
+            elif self.text_backend == "pdfminer":
+                raw_text = self._pdfminer_text(page_number)
+            else:
+                raw_text = self._get_pdfplumber_page(page_number).extract_text() or ""
         except Exception as e:
             # Handle encrypted pages, malformed content, etc.
             warning_msg = f"Failed to extract text from page {page_number}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
+            logger.warning(warning_msg)
             ExtractionWarning.add(warning_msg)
             raw_text = ""
 
-        # Split into lines and clean up
-        lines = []
-        for line in raw_text.split("\n"):
-            cleaned = line.strip()
-            if cleaned:
-                lines.append(cleaned)
+        # Split into lines and clean up; filter(None, ...) drops empty lines in C
+        lines = list(filter(None, map(str.strip, raw_text.splitlines())))
 
-        return PageContent(
+        entry.content = PageContent(
             page_number=page_number,
             lines=lines,
             raw_text=raw_text,
         )
+        if flush:
+            self.flush_page(page_number)
+        return entry.content
 
-    def iter_pages(self, start_page: int = 1) -> Iterator[PageContent]:
-        """Iterate through pages starting from a given page."""
-        for page_num in range(start_page, self.total_pages + 1):
-            yield self.get_page(page_num)
+    def flush_page(self, page_number: int) -> None:
+        """Release pdfplumber's cached chars/objects and detected tables for a page.
 
-    def extract_tables(self, page_number: int) -> list[list[list[str]]]:
-        """Extract tables from a specific page (1-indexed).
+        Extracted text and table results stay cached; other methods re-parse
+        the page if they need it again.
+        """
+        self._parsed_pages.pop(page_number, None)
+        entry = self._page_cache.get(page_number)
+        if entry is not None:
+            entry.page.close()
+            entry.found_tables = None
+
+    def iter_pages(
+        self, start_page: int = 1, prefetch: int = 0, end_page: Optional[int] = None
+    ) -> Iterator[PageContent]:
+        """Iterate through pages starting from a given page.
+
+        Pages are extracted serially by default. With prefetch > 0, up to
+        `prefetch` following pages are parsed in a background thread while
+        the caller works on one page. The thread uses its own pdfplumber
+        instance over the same bytes, so no parser state is shared between
+        threads, but it doubles the open documents and its pages bypass
+        this reader's page cache. Each page's parsed objects are released
+        once it has been read, so memory stays bounded however many pages
+        are visited.
 
-        Returns empty list if extraction fails.
+        Args:
+            start_page: 1-indexed page to start from
+            prefetch: Number of pages to parse ahead in the background (default 0)
+            end_page: Last 1-indexed page to read, inclusive (default: last page)
         """
-        if not self._pdf:
-            raise RuntimeError("PDF not opened. Use context manager.")
+        last_page = self.total_pages if end_page is None else min(end_page, self.total_pages)
+        page_numbers = range(start_page, last_page + 1)
+        if prefetch <= 0 or len(page_numbers) <= 1:
+            for page_num in page_numbers:
+                yield self.get_page(page_num)
+                # Sequential reads don't come back to a page, so free its
+                # parsed objects once the caller is done with it
+                self.flush_page(page_num)
+            return
+
+        pages: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            # Give up once the consumer has stopped iterating
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def producer() -> None:
+            reader = self._open_copy()
+            try:
+                for page_num in page_numbers:
+                    if not put(reader.get_page(page_num, flush=True)):
+                        return
+                put(None)
+            except Exception as e:
+                put(e)
+            finally:
+                reader.__exit__(None, None, None)
+
+        threading.Thread(target=producer, daemon=True).start()
+        try:
+            while (item := pages.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    def _open_copy(self) -> "PDFReader":
+        """Open a second reader over the same in-memory PDF, for use from another thread."""
+        reader = PDFReader(self.pdf_path, text_backend=self.text_backend)
+        reader._pdf_bytes = self._pdf_bytes
+        reader._open_documents()
+        return reader
+
+    def iter_pages_parallel(
+        self,
+        start_page: int = 1,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[PageContent]:
+        """Iterate through pages, extracting them in a process pool.
+
+        Text extraction is CPU-bound pure Python, so pages are split into
+        batches of chunk_size and parsed in worker processes, each of which
+        opens the PDF once. Pages are yielded in order, same as iter_pages().
+        Falls back to iter_pages() when there is a single worker or everything
+        fits in a single batch.
 
-        if page_number < 1 or page_number > self.total_pages:
-            raise ValueError(f"Page {page_number} out of range (1-{self.total_pages})")
+        Args:
+            start_page: 1-indexed page to start from
+            max_workers: Number of worker processes (default: CPU count - 1)
+            chunk_size: Pages per worker task (default: about 4 batches per
+                worker so one slow batch doesn't leave the others idle, but at
+                least MIN_PARALLEL_CHUNK pages to amortise task overhead)
+        """
+        page_numbers = range(start_page, self.total_pages + 1)
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+        if chunk_size is None:
+            chunk_size = max(self.MIN_PARALLEL_CHUNK, math.ceil(len(page_numbers) / (max_workers * 4)))
+        if max_workers <= 1 or len(page_numbers) <= chunk_size:
+            yield from self.iter_pages(start_page)
+            return
+
+        batches = [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(batches)),
+            mp_context=self._worker_mp_context(),
+            initializer=_init_page_worker,
+            initargs=(self.pdf_path, self.text_backend),
+        ) as executor:
+            try:
+                # map() returns batch results in submission order
+                for pages in executor.map(_extract_page_batch, batches):
+                    yield from pages
+            finally:
+                # If the caller stops early, drop the batches no worker has
+                # started instead of parsing the rest of the document
+                executor.shutdown(cancel_futures=True)
+
+    def _worker_mp_context(self):
+        """Return the multiprocessing context for this reader's worker pools.
+
+        Children forked from a process that has initialised PDFium deadlock,
+        so the pdfium backend starts workers from a clean forkserver instead
+        (callers' scripts then need the usual `if __name__ == "__main__"` guard).
+        """
+        if self.text_backend == "pdfium" and "forkserver" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("forkserver")
+        return None
+
+    def iter_pages_auto(self, start_page: int = 1) -> Iterator[PageContent]:
+        """Iterate through pages, picking a strategy from the number of pages.
+
+        Small ranges are read serially (a pool's startup cost would dominate),
+        medium ones with background prefetch and large ones in a process
+        pool; see _ITER_PAGES_RULES.
+        """
+        num_pages = max(0, self.total_pages - start_page + 1)
+        for max_pages, mode, options in _ITER_PAGES_RULES:
+            if num_pages <= max_pages:
+                break
+
+        if mode == "serial":
+            yield from self.iter_pages(start_page, prefetch=0)
+        elif mode == "prefetch":
+            yield from self.iter_pages(start_page, **options)
+        else:
+            chunk_size = options["chunk_size"]
+            workers = max(1, min((os.cpu_count() or 2) - 1, math.ceil(num_pages / chunk_size)))
+            yield from self.iter_pages_parallel(start_page, max_workers=workers, chunk_size=chunk_size)
 
-        page = self._pdf.pages[page_number - 1]
+    @_require_page
+    def extract_tables(self, page_number: int) -> list[list[list[str]]]:
+        """Extract tables from a specific page (1-indexed).
+
+        Returns empty list if extraction fails. Results are cached per page;
+        treat the returned lists as read-only.
+        """
+        entry = self._cached_page(page_number)
+        if entry.tables is not None:
+            return entry.tables
 
         try:
-            tables = page.extract_tables() or []
+            # Same as page.extract_tables(), but reusing the cached table detection
+            tables = [table.extract() for table in self._tables_on_page(page_number)]
         except Exception as e:
             # Handle extraction failures gracefully
             warning_msg = f"Failed to extract tables from page {page_number}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
+            logger.warning(warning_msg)
             ExtractionWarning.add(warning_msg)
             return []
 
-        # Clean up table cells
-        cleaned_tables = []
-        for table in tables:
-            cleaned_table = []
-            for row in table:
-                cleaned_row = [cell.strip() if cell else "" for cell in row]
-                if any(cleaned_row):  # Skip empty rows
-                    cleaned_table.append(cleaned_row)
-            if cleaned_table:
-                cleaned_tables.append(cleaned_table)
+        # Clean up table cells, dropping empty rows and then empty tables.
+        # Inline conditional: cheaper than calling str.strip via map() or a helper.
+        # np.char.strip over an object array is slower still, even for 5000-row
+        # tables - converting to and from fixed-width strings costs more than it saves.
+        cleaned_tables = [
+            cleaned_table
+            for cleaned_table in (
+                [
+                    _intern_short(row)
+                    for row in ([cell.strip() if cell else "" for cell in raw_row] for raw_row in table)
+                    if any(row)
+                ]
+                for table in tables
+            )
+            if cleaned_table
+        ]
 
+        entry.tables = cleaned_tables
         return cleaned_tables
 
-    def extract_tables_with_positions(self, page_number: int) -> list[dict]:
+    @_require_page
+    def extract_tables_with_positions(self, page_number: int) -> list[ExtractedTable]:
         """Extract tables with cell bounding boxes for each cell.
 
-        Returns a list of table dicts, each containing:
-        - 'rows': list of rows, each row is a list of cell dicts with 'text' and 'bbox'
-        - 'bbox': bounding box of entire table
+        Returns a list of ExtractedTable objects, each with the bounding box
+        of the entire table and rows of TableCell (text and bbox of each cell)
 
         Args:
             page_number: 1-indexed page number
 
         Returns:
-            List of table dicts with position data
+            List of ExtractedTable with position data (cached per page; treat as read-only)
         """
-        if not self._pdf:
-            raise RuntimeError("PDF not opened. Use context manager.")
+        entry = self._cached_page(page_number)
+        if entry.positioned_tables is None:
+            for _ in self.iter_tables_with_positions(page_number):
+                pass
+        return entry.positioned_tables if entry.positioned_tables is not None else []
 
-        if page_number < 1 or page_number > self.total_pages:
-            raise ValueError(f"Page {page_number} out of range (1-{self.total_pages})")
+    @_require_page
+    def iter_tables_with_positions(self, page_number: int) -> Iterator[ExtractedTable]:
+        """Yield the tables of extract_tables_with_positions() one at a time.
 
-        page = self._pdf.pages[page_number - 1]
+        Each table's text is only extracted when it is reached, so callers that
+        stop at the first match skip the rest. The page's list is cached once
+        iteration completes.
+
+        Args:
+            page_number: 1-indexed page number
+
+        Yields:
+            ExtractedTable with position data (treat as read-only)
+        """
+        entry = self._cached_page(page_number)
+        if entry.positioned_tables is not None:
+            yield from entry.positioned_tables
+            return
 
         try:
-            tables = page.find_tables()
+            tables = self._tables_on_page(page_number)
         except Exception as e:
             warning_msg = f"Failed to find tables on page {page_number}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
+            logger.warning(warning_msg)
             ExtractionWarning.add(warning_msg)
-            return []
+            return
 
         result = []
         for table in tables:
-            table_data = {
-                'bbox': table.bbox,  # (x0, y0, x1, y1)
-                'rows': []
-            }
+            table_data = ExtractedTable(table.bbox)  # (x0, y0, x1, y1)
 
             # Get extracted text for all rows
             extracted_rows = table.extract()
+            # Table.rows regroups all cells on every access, so read it once
+            row_objs = table.rows
 
             # Validate row counts match
-            if len(table.rows) != len(extracted_rows):
-                print(
-                    f"Warning: Row count mismatch on page {page_number}: "
-                    f"{len(table.rows)} row objects vs {len(extracted_rows)} text rows",
-                    file=sys.stderr
+            if len(row_objs) != len(extracted_rows):
+                logger.warning(
+                    "Row count mismatch on page %d: %d row objects vs %d text rows",
+                    page_number, len(row_objs), len(extracted_rows),
                 )
 
             # Combine row bboxes with extracted text
             # Use zip_longest to handle potential mismatches without data loss
-            for row_obj, row_text in zip_longest(table.rows, extracted_rows, fillvalue=None):
-                row_data = []
+            for row_obj, row_text in zip_longest(row_objs, extracted_rows, fillvalue=None):
                 # Handle case where row_obj or row_text is None due to mismatch
                 cells = row_obj.cells if row_obj else []
-                texts = row_text if row_text else []
+                texts = _intern_short([text.strip() if text else '' for text in row_text]) if row_text else []
 
-                # Validate cell counts match
-                if cells and texts and len(cells) != len(texts):
-                    print(
-                        f"Warning: Cell count mismatch on page {page_number}: "
-                        f"{len(cells)} cell bboxes vs {len(texts)} text cells",
-                        file=sys.stderr
-                    )
-
-                # row_obj.cells contains bboxes for each cell in the row
+                # row_obj.cells contains bboxes (x0, y0, x1, y1) or None for each cell
                 # row_text contains the extracted text for each cell
-                for cell_bbox, cell_text in zip_longest(cells, texts, fillvalue=None):
-                    row_data.append({
-                        'text': cell_text.strip() if cell_text else '',
-                        'bbox': cell_bbox  # (x0, y0, x1, y1) or None
-                    })
-                table_data['rows'].append(row_data)
+                if len(cells) == len(texts):
+                    # Common case - pair them up directly
+                    row_data = [TableCell(text, bbox) for bbox, text in zip(cells, texts)]
+                else:
+                    if cells and texts:
+                        logger.warning(
+                            "Cell count mismatch on page %d: %d cell bboxes vs %d text cells",
+                            page_number, len(cells), len(texts),
+                        )
+                    row_data = [
+                        TableCell(text or '', bbox)  # text is None when texts is shorter
+                        for bbox, text in zip_longest(cells, texts, fillvalue=None)
+                    ]
+                table_data.rows.append(row_data)
 
             result.append(table_data)
+            yield table_data
 
-        return result
+        entry.positioned_tables = result
+
+    def extract_tables_with_positions_soa(self, page_number: int) -> dict[str, "np.ndarray"]:
+        """Extract tables with cell positions as column arrays.
+
+        Same data as extract_tables_with_positions(), but with one array per
+        field over all cells of all tables on the page, so bbox filtering
+        and coordinate transforms can be done with NumPy operations.
+
+        Args:
+            page_number: 1-indexed page number
 
-    def extract_tables_camelot(self, page_number: int, flavor: str | None = None) -> list[dict]:
+        Returns:
+            dict with 'table_bboxes' (T x 4 float32), 'cell_bboxes' (C x 4
+            float32, NaN where a cell has no bbox), 'cell_texts' (object) and
+            'cell_table_idx', 'cell_row_idx', 'cell_col_idx' (int32) arrays
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for extract_tables_with_positions_soa()")
+
+        tables = self.extract_tables_with_positions(page_number)
+        nan_bbox = (math.nan,) * 4
+        table_bboxes = [table.bbox or nan_bbox for table in tables]
+        cell_bboxes, cell_texts, table_idx, row_idx, col_idx = [], [], [], [], []
+        for t, table in enumerate(tables):
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row):
+                    cell_bboxes.append(cell.bbox or nan_bbox)
+                    cell_texts.append(cell.text)
+                    table_idx.append(t)
+                    row_idx.append(r)
+                    col_idx.append(c)
+
+        return {
+            'table_bboxes': np.array(table_bboxes, dtype=np.float32).reshape(-1, 4),
+            'cell_bboxes': np.array(cell_bboxes, dtype=np.float32).reshape(-1, 4),
+            'cell_texts': np.array(cell_texts, dtype=object),
+            'cell_table_idx': np.array(table_idx, dtype=np.int32),
+            'cell_row_idx': np.array(row_idx, dtype=np.int32),
+            'cell_col_idx': np.array(col_idx, dtype=np.int32),
+        }
+
+    def extract_tables_camelot(self, page_number: int, flavor: str | None = None) -> list[ExtractedTable]:
         """Extract tables using Camelot (higher accuracy for some PDFs).
 
         Automatically detects whether to use 'lattice' (bordered tables) or
         'stream' (borderless tables) mode based on page content.
 
         Returns same format as extract_tables_with_positions() for compatibility:
-        - 'rows': list of rows, each row is a list of cell dicts with 'text' and 'bbox'
-        - 'bbox': bounding box of entire table
+        ExtractedTable objects with the bounding box of the entire table and
+        rows of TableCell (text and bbox of each cell)
 
         Args:
             page_number: 1-indexed page number
             flavor: 'lattice', 'stream', or None (auto-detect)
 
         Returns:
-            List of table dicts with position data, or empty list if Camelot unavailable
+            List of ExtractedTable with position data, or empty list if Camelot unavailable
         """
-        if not CAMELOT_AVAILABLE:
-            return []
+        return self.extract_tables_camelot_batch([page_number], flavor)[page_number]
 
-        try:
-            # Auto-detect flavor based on page borders
-            if flavor is None:
-                has_borders = self._detect_page_borders(page_number)
-                flavor = 'lattice' if has_borders else 'stream'
-
-            tables = camelot.read_pdf(
-                str(self.pdf_path),
-                pages=str(page_number),
-                flavor=flavor
-            )
-        except Exception as e:
-            warning_msg = f"Camelot ({flavor}) failed on page {page_number}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
-            ExtractionWarning.add(warning_msg)
-            # If lattice failed, try stream as fallback
-            if flavor == 'lattice':
-                try:
-                    tables = camelot.read_pdf(
-                        str(self.pdf_path),
-                        pages=str(page_number),
-                        flavor='stream'
-                    )
-                except Exception:
-                    return []
-            else:
-                return []
+    def extract_tables_camelot_batch(
+        self, page_numbers: Iterable[int], flavor: str | None = None
+    ) -> dict[int, list[ExtractedTable]]:
+        """Extract Camelot tables for several pages at once.
 
-        result = []
-        for table in tables:
-            # Get the table's bounding box from Camelot
-            # Camelot stores bbox as (x0, y0, x1, y1) in _bbox attribute
-            table_bbox = getattr(table, '_bbox', None)
+        Pages sharing a flavor are parsed in a single Camelot run instead of
+        one run per page. Successful results are cached, so
+        extract_tables_camelot() on a page that was part of a batch doesn't
+        run Camelot again; failed runs are retried on the next call.
 
-            # Convert DataFrame to our dict format
-            df = table.df
-            if df.empty:
+        Args:
+            page_numbers: 1-indexed page numbers
+            flavor: 'lattice', 'stream', or None (auto-detect per page)
+
+        Returns:
+            Dict of page number -> list of ExtractedTable, as extract_tables_camelot()
+        """
+        page_numbers = list(page_numbers)
+        if not CAMELOT_AVAILABLE:
+            return {page_num: [] for page_num in page_numbers}
+
+        results: dict[int, list[ExtractedTable]] = {}
+        pages_by_flavor: dict[str, list[int]] = {}
+        for page_num in page_numbers:
+            cached = self._camelot_tables.get((page_num, flavor))
+            if cached is not None:
+                results[page_num] = cached
                 continue
+            page_flavor = flavor
+            if page_flavor is None:
+                # Auto-detect flavor based on page borders
+                try:
+                    page_flavor = 'lattice' if self._detect_page_borders(page_num) else 'stream'
+                except Exception as e:
+                    warning_msg = f"Camelot failed on page {page_num}: {e}"
+                    logger.warning(warning_msg)
+                    ExtractionWarning.add(warning_msg)
+                    results[page_num] = []
+                    continue
+            pages_by_flavor.setdefault(page_flavor, []).append(page_num)
 
-            table_data = {
-                'bbox': table_bbox,
-                'rows': []
-            }
+        for page_flavor, pages in pages_by_flavor.items():
+            parsed = True
+            try:
+                tables = self._camelot_parse(pages, page_flavor)
+            except Exception as e:
+                warning_msg = (
+                    f"Camelot ({page_flavor}) failed on page{'s' if len(pages) > 1 else ''} "
+                    f"{', '.join(map(str, pages))}: {e}"
+                )
+                logger.warning(warning_msg)
+                ExtractionWarning.add(warning_msg)
+                tables = []
+                parsed = False
+                # If lattice failed, try stream as fallback
+                if page_flavor == 'lattice':
+                    try:
+                        tables = self._camelot_parse(pages, 'stream')
+                        parsed = True
+                    except Exception:
+                        pass
+
+            page_tables: dict[int, list[ExtractedTable]] = {page_num: [] for page_num in pages}
+            for page_num, table in tables:
+                table_data = self._camelot_table_data(table)
+                if table_data is not None:
+                    page_tables[page_num].append(table_data)
+            # Failures may be transient (temp files, Ghostscript) - only cache real results
+            if parsed:
+                for page_num, tables_on_page in page_tables.items():
+                    self._camelot_tables[(page_num, flavor)] = tables_on_page
+            results.update(page_tables)
+
+        return results
+
+    def extract_tables_camelot_range(
+        self, start: int, end: int, flavor: str | None = None
+    ) -> dict[int, list[ExtractedTable]]:
+        """Extract Camelot tables for an inclusive page range.
+
+        Shorthand for extract_tables_camelot_batch(range(start, end + 1), flavor).
 
-            # Get cell positions from Camelot's cells attribute if available
-            # cells is a list of lists containing cell objects
-            cell_positions = getattr(table, 'cells', None)
+        Args:
+            start: First 1-indexed page number
+            end: Last 1-indexed page number (inclusive)
+            flavor: 'lattice', 'stream', or None (auto-detect per page)
 
-            for row_idx, row in df.iterrows():
-                row_data = []
-                for col_idx, cell_text in enumerate(row):
-                    cell_bbox = None
-                    # Try to get cell bbox from Camelot
-                    if cell_positions and row_idx < len(cell_positions):
-                        row_cells = cell_positions[row_idx]
-                        if col_idx < len(row_cells):
-                            cell = row_cells[col_idx]
-                            # Check all four bbox attributes exist before using them
-                            if (hasattr(cell, 'x1') and hasattr(cell, 'y1') and
-                                    hasattr(cell, 'x2') and hasattr(cell, 'y2')):
-                                cell_bbox = (cell.x1, cell.y1, cell.x2, cell.y2)
-
-                    row_data.append({
-                        'text': str(cell_text).strip() if cell_text else '',
-                        'bbox': cell_bbox
-                    })
-                table_data['rows'].append(row_data)
+        Returns:
+            Dict of page number -> list of ExtractedTable
+        """
+        if not self._pdf:
+            raise RuntimeError("PDF not opened. Use context manager.")
+        if start < 1 or end > self.total_pages or start > end:
+            raise ValueError(f"Invalid page range {start}-{end} (1-{self.total_pages})")
+        return self.extract_tables_camelot_batch(range(start, end + 1), flavor)
 
-            result.append(table_data)
+    @staticmethod
+    def _camelot_table_data(table) -> Optional[ExtractedTable]:
+        """Convert a Camelot table to the extract_tables_with_positions() format.
 
-        return result
+        Returns None for tables without any cells.
+        """
+        # Get the table's bounding box from Camelot
+        # Camelot stores bbox as (x0, y0, x1, y1) in _bbox attribute
+        table_bbox = getattr(table, '_bbox', None)
+
+        # Convert DataFrame to our dict format
+        df = table.df
+        if df.empty:
+            return None
+
+        table_data = ExtractedTable(table_bbox)
+
+        # Get cell positions from Camelot's cells attribute if available
+        # cells is a list of lists containing cell objects
+        cell_positions = getattr(table, 'cells', None)
+
+        # Plain lists instead of iterrows(), which builds a Series per row
+        for row_idx, row in enumerate(df.to_numpy(dtype=object).tolist()):
+            row_data = []
+            # Try to get cell bboxes from Camelot
+            row_cells = cell_positions[row_idx] if cell_positions and row_idx < len(cell_positions) else ()
+            for col_idx, cell_text in enumerate(row):
+                cell_bbox = None
+                if col_idx < len(row_cells):
+                    cell = row_cells[col_idx]
+                    # Check all four bbox attributes exist before using them
+                    if (hasattr(cell, 'x1') and hasattr(cell, 'y1') and
+                            hasattr(cell, 'x2') and hasattr(cell, 'y2')):
+                        cell_bbox = (cell.x1, cell.y1, cell.x2, cell.y2)
+
+                row_data.append(TableCell(str(cell_text).strip() if cell_text else '', cell_bbox))
+            table_data.rows.append(row_data)
+
+        return table_data
+
+    def _camelot_parse(self, page_numbers: list[int], flavor: str) -> list[tuple[int, object]]:
+        """Run Camelot on some pages, returning (page number, table) pairs.
+
+        Camelot splits each requested page out of the full PDF, re-reading
+        it every time. Instead, the pages are first copied into one small PDF
+        (see _camelot_pages_file) so Camelot and the lattice->stream fallback
+        only re-read that.
+        """
+        if PYMUPDF_AVAILABLE and self._pdf_bytes is not None:
+            filepath = self._camelot_pages_file(tuple(page_numbers))
+            read_pages = list(range(1, len(page_numbers) + 1))
+            # Table.page is the page's position in the subset file
+            page_for = dict(zip(read_pages, page_numbers))
+        else:
+            filepath, read_pages, page_for = self._pdf_path_str, page_numbers, None
+        tables = _camelot().read_pdf(filepath, pages=",".join(map(str, read_pages)), flavor=flavor)
+        return [
+            (page_for[int(table.page)] if page_for else int(table.page), table)
+            for table in tables
+        ]
+
+    def _camelot_pages_file(self, page_numbers: tuple[int, ...]) -> str:
+        """Return the path of a PDF holding just the given pages, creating it on first use.
 
-    def extract_text_with_layout(self, page_number: int) -> list[dict]:
+        Files live in a temp directory that is removed in __exit__.
+        """
+        path = self._camelot_page_files.get(page_numbers)
+        if path is None:
+            if self._camelot_tmpdir is None:
+                self._camelot_tmpdir = tempfile.mkdtemp(prefix="camelot_pages_")
+            path = os.path.join(self._camelot_tmpdir, f"pages_{len(self._camelot_page_files)}.pdf")
+            with _pymupdf_lock:
+                with pymupdf.open(stream=self._pdf_bytes, filetype="pdf") as src, pymupdf.open() as dst:
+                    for page_num in page_numbers:
+                        dst.insert_pdf(src, from_page=page_num - 1, to_page=page_num - 1)
+                    dst.save(path)
+            self._camelot_page_files[page_numbers] = path
+        return path
+
+    def _analyze_layout(self, page_number: int, laparams: LAParams) -> LTPage:
+        """Run pdfminer layout analysis on a page of the open PDF.
+
+        Reuses the document, page objects and resource manager pdfplumber
+        already parsed, instead of extract_pages() re-opening the file and
+        re-parsing the xref on every call. The interpreter for the default
+        LAParams is kept for the lifetime of the reader.
+        """
+        if laparams is _DEFAULT_LAPARAMS and self._layout_interpreter is not None:
+            device, interpreter = self._layout_interpreter
+        else:
+            device = PDFPageAggregator(self._pdf.rsrcmgr, laparams=laparams)
+            interpreter = PDFPageInterpreter(self._pdf.rsrcmgr, device)
+            if laparams is _DEFAULT_LAPARAMS:
+                self._layout_interpreter = (device, interpreter)
+
+        interpreter.process_page(self._get_pdfplumber_page(page_number).page_obj)
+        return device.get_result()
+
+    def extract_text_with_layout(self, page_number: int, laparams: Optional[LAParams] = None) -> list[dict]:
         """Extract text blocks with positions using pdfminer.six.
 
         Returns list of text blocks with bounding boxes:
@@ -557,81 +1324,219 @@ class PDFReader:
 
         Args:
             page_number: 1-indexed page number
+            laparams: Layout analysis parameters (default: _DEFAULT_LAPARAMS)
 
         Returns:
             List of text block dicts with position data
         """
-        laparams = LAParams(
-            line_margin=0.3,       # Tighter line grouping for better row detection
-            word_margin=0.15,      # Closer word grouping for column separation
-            char_margin=2.0,
-            boxes_flow=0.7,        # Stronger column separation for multi-column layouts
-            detect_vertical=True,  # Enable vertical text detection
-        )
+        return self.extract_text_with_layout_range([page_number], laparams)[page_number]
 
-        result = []
+    def extract_text_with_layout_range(
+        self, pages: Iterable[int], laparams: Optional[LAParams] = None
+    ) -> dict[int, list[dict]]:
+        """Extract text blocks with positions for several pages using pdfminer.six.
+
+        When the reader isn't open, all pages come from a single extract_pages()
+        pass, so pdfminer parses the file and its xref once rather than per page.
+
+        Args:
+            pages: 1-indexed page numbers
+            laparams: Layout analysis parameters (default: _DEFAULT_LAPARAMS)
+
+        Returns:
+            Dict of page number -> list of text block dicts, as extract_text_with_layout().
+            Page numbers outside the document map to an empty list.
+        """
+        if laparams is None:
+            laparams = _DEFAULT_LAPARAMS
+
+        page_numbers = sorted(set(pages))
+        result: dict[int, list[dict]] = {page_number: [] for page_number in page_numbers}
 
+        if self._pdf:
+            for page_number in page_numbers:
+                # Out-of-range pages have no blocks - skipped silently, as
+                # pdfminer does below (page 0 would otherwise wrap to the last)
+                if not 1 <= page_number <= self.total_pages:
+                    continue
+                try:
+                    page_layout = self._analyze_layout(page_number, laparams)
+                    result[page_number] = self._layout_text_blocks(page_layout)
+                except Exception as e:
+                    warning_msg = f"pdfminer failed on page {page_number}: {e}"
+                    logger.warning(warning_msg)
+                    ExtractionWarning.add(warning_msg)
+            return result
+
+        # extract_pages() yields the requested layouts in page order and skips
+        # pages past the end; page numbers below 1 would shift that order
+        page_numbers = [page_number for page_number in page_numbers if page_number >= 1]
+        if not page_numbers:
+            return result
+
+        done = 0
         try:
-            # extract_pages yields page layouts
-            for _page_idx, page_layout in enumerate(extract_pages(
-                str(self.pdf_path),
+            page_layouts = extract_pages(
+                self._pdf_path_str,
                 laparams=laparams,
-                page_numbers=[page_number - 1]  # 0-indexed
-            )):
-                # Iterate through elements on the page
-                for element in page_layout:
-                    if isinstance(element, LTTextBoxHorizontal):
-                        text = element.get_text().strip()
-                        if text:
-                            # Get individual lines within the text box
-                            lines = []
-                            for line in element:
-                                if isinstance(line, LTTextLineHorizontal):
-                                    line_text = line.get_text().strip()
-                                    if line_text:
-                                        lines.append({
-                                            'text': line_text,
-                                            'bbox': (line.x0, line.y0, line.x1, line.y1)
-                                        })
-
-                            result.append({
-                                'text': text,
-                                'bbox': (element.x0, element.y0, element.x1, element.y1),
-                                'lines': lines
-                            })
+                page_numbers=[n - 1 for n in page_numbers]  # 0-indexed
+            )
+            for page_layout in page_layouts:
+                result[page_numbers[done]] = self._layout_text_blocks(page_layout)
+                done += 1
         except Exception as e:
-            warning_msg = f"pdfminer failed on page {page_number}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
+            failed = page_numbers[min(done, len(page_numbers) - 1)]
+            warning_msg = f"pdfminer failed on page {failed}: {e}"
+            logger.warning(warning_msg)
             ExtractionWarning.add(warning_msg)
 
         return result
 
-    def extract_tables_docling(self, page_num: int) -> list[dict]:
+    @staticmethod
+    def _layout_text_blocks(page_layout: LTPage) -> list[dict]:
+        """Convert a pdfminer page layout into extract_text_with_layout() blocks."""
+        result = []
+        # Iterate through elements on the page. pdfminer never subclasses
+        # its layout types, so exact type checks replace isinstance()
+        for element in page_layout:
+            if type(element) is not LTTextBoxHorizontal:
+                continue
+
+            # A horizontal box only holds horizontal lines and its text is
+            # their concatenation, so each line's text is built just once
+            line_texts = [(line, line.get_text()) for line in element
+                          if type(line) is LTTextLineHorizontal]
+            text = "".join(line_text for _, line_text in line_texts).strip()
+            if not text:
+                continue
+
+            # Get individual lines within the text box
+            lines = [
+                {'text': line_text, 'bbox': (line.x0, line.y0, line.x1, line.y1)}
+                for line, raw_text in line_texts
+                if (line_text := raw_text.strip())
+            ]
+
+            result.append({
+                'text': text,
+                'bbox': (element.x0, element.y0, element.x1, element.y1),
+                'lines': lines
+            })
+        return result
+
+    def extract_layout_bulk(self, pages: Optional[Iterable[int]] = None) -> dict[str, "np.ndarray"]:
+        """Extract positioned text lines from many pages as column arrays.
+
+        Unlike extract_text_with_layout(), which returns a dict per block,
+        each field is returned as one array over all lines of all pages, so
+        grouping and sorting by position can be done with NumPy operations
+        (e.g. np.lexsort((x0, -y0)) for reading order).
+
+        Args:
+            pages: 1-indexed page numbers (default: all pages)
+
+        Returns:
+            dict with 'text' (object), 'x0', 'y0', 'x1', 'y1' (float32)
+            and 'page' (int32) arrays of equal length
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for extract_layout_bulk()")
+        if not self._pdf:
+            raise RuntimeError("PDF not opened. Use context manager.")
+
+        if pages is None:
+            pages = range(1, self.total_pages + 1)
+
+        texts, x0s, y0s, x1s, y1s, page_numbers = [], [], [], [], [], []
+        for page_number in pages:
+            try:
+                page_layout = self._analyze_layout(page_number, _DEFAULT_LAPARAMS)
+            except Exception as e:
+                warning_msg = f"pdfminer failed on page {page_number}: {e}"
+                logger.warning(warning_msg)
+                ExtractionWarning.add(warning_msg)
+                continue
+
+            for element in page_layout:
+                if type(element) is not LTTextBoxHorizontal:
+                    continue
+                for line in element:
+                    if type(line) is not LTTextLineHorizontal:
+                        continue
+                    text = line.get_text().strip()
+                    if text:
+                        texts.append(text)
+                        x0s.append(line.x0)
+                        y0s.append(line.y0)
+                        x1s.append(line.x1)
+                        y1s.append(line.y1)
+                        page_numbers.append(page_number)
+
+        return {
+            'text': np.array(texts, dtype=object),
+            'x0': np.array(x0s, dtype=np.float32),
+            'y0': np.array(y0s, dtype=np.float32),
+            'x1': np.array(x1s, dtype=np.float32),
+            'y1': np.array(y1s, dtype=np.float32),
+            'page': np.array(page_numbers, dtype=np.int32),
+        }
+
+    def _docling_conversion(self):
+        """Return the Docling conversion of the whole PDF (expensive) - thread-safe.
+
+        Cached on the reader and in a small module-level LRU shared by all readers.
+        """
+        with self._docling_lock:
+            if self._docling_result is not None:
+                return self._docling_result
+
+            try:
+                stat = self.pdf_path.stat()
+                key = (str(self.pdf_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                key = None  # No file to identify the contents by; don't share
+            with _docling_results_lock:
+                result = _docling_results.get(key) if key else None
+                if result is not None:
+                    _docling_results.move_to_end(key)
+
+            if result is None:
+                converter = _get_docling_converter()
+                if self._pdf_bytes is not None:
+                    source = _docling_document_stream()(name=self.pdf_path.name, stream=io.BytesIO(self._pdf_bytes))
+                else:
+                    source = self._pdf_path_str
+                result = converter.convert(source)
+                if key:
+                    with _docling_results_lock:
+                        _docling_results[key] = result
+                        if len(_docling_results) > _DOCLING_CACHE_SIZE:
+                            _docling_results.popitem(last=False)
+
+            self._docling_result = result
+            return result
+
+    def extract_tables_docling(self, page_num: int) -> list[ExtractedTable]:
         """Extract tables using Docling (IBM) - AI-powered table detection.
 
         Docling uses TableFormer AI for high-accuracy table structure recognition.
         Particularly effective for borderless and complex tables.
 
         Returns same format as extract_tables_with_positions():
-        - 'rows': list of rows, each row is a list of cell dicts with 'text' and 'bbox'
-        - 'bbox': bounding box of entire table
+        ExtractedTable objects with the bounding box of the entire table and
+        rows of TableCell (text and bbox of each cell)
 
         Args:
             page_num: 1-indexed page number
 
         Returns:
-            List of table dicts with position data, or empty list if Docling unavailable
+            List of ExtractedTable with position data, or empty list if Docling unavailable
         """
         if not DOCLING_AVAILABLE:
             return []
 
         try:
-            # Cache Docling conversion result (expensive operation) - thread-safe
-            with self._docling_lock:
-                if self._docling_result is None:
-                    converter = DocumentConverter()
-                    self._docling_result = converter.convert(str(self.pdf_path))
-                result = self._docling_result
+            result = self._docling_conversion()
             tables = []
 
             # Docling uses iterate_items() to access document elements
@@ -653,32 +1558,27 @@ class PDFReader:
                     else:
                         table_bbox = None
 
-                    table_data = {
-                        'bbox': table_bbox,
-                        'rows': []
-                    }
+                    table_data = ExtractedTable(table_bbox)
 
                     # Try export_to_dataframe first (most reliable)
                     if hasattr(item, 'export_to_dataframe'):
                         try:
                             # Pass doc argument to avoid deprecation warning
                             df = item.export_to_dataframe(doc=result.document)
-                            for _, row in df.iterrows():
-                                row_data = []
-                                for cell in row:
-                                    cell_text = str(cell) if cell is not None else ''
-                                    row_data.append({
-                                        'text': cell_text.strip(),
-                                        'bbox': None
-                                    })
+                            # Plain lists instead of iterrows(), which builds a Series per row
+                            for row in df.to_numpy(dtype=object).tolist():
+                                row_data = [
+                                    TableCell(str(cell).strip() if cell is not None else '')
+                                    for cell in row
+                                ]
                                 if row_data:
-                                    table_data['rows'].append(row_data)
+                                    table_data.rows.append(row_data)
                         except Exception as e:
                             # Log and fall through to data.table_cells
-                            print(f"Debug: export_to_dataframe failed: {e}", file=sys.stderr)
+                            logger.debug("export_to_dataframe failed: %s", e)
 
                     # Fallback: access data.table_cells directly
-                    if not table_data['rows'] and hasattr(item, 'data') and item.data:
+                    if not table_data.rows and hasattr(item, 'data') and item.data:
                         data = item.data
                         if hasattr(data, 'table_cells') and data.table_cells:
                             # Build rows from table_cells
@@ -686,53 +1586,54 @@ class PDFReader:
                             num_rows = getattr(data, 'num_rows', 0)
                             num_cols = getattr(data, 'num_cols', 0)
                             if num_rows and num_cols:
-                                # Initialize empty grid
-                                grid = [['' for _ in range(num_cols)] for _ in range(num_rows)]
+                                # Initialize empty grid (list repetition is fine - strings are immutable)
+                                grid = [[''] * num_cols for _ in range(num_rows)]
                                 for cell in data.table_cells:
-                                    if hasattr(cell, 'start_row_offset_idx') and hasattr(cell, 'start_col_offset_idx'):
-                                        r, c = cell.start_row_offset_idx, cell.start_col_offset_idx
-                                        if 0 <= r < num_rows and 0 <= c < num_cols:
-                                            cell_text = getattr(cell, 'text', '') or ''
-                                            grid[r][c] = cell_text
+                                    r = getattr(cell, 'start_row_offset_idx', None)
+                                    c = getattr(cell, 'start_col_offset_idx', None)
+                                    if r is not None and c is not None and 0 <= r < num_rows and 0 <= c < num_cols:
+                                        grid[r][c] = getattr(cell, 'text', '') or ''
                                 # Convert grid to our format
                                 for row in grid:
-                                    row_data = [{'text': cell.strip(), 'bbox': None} for cell in row]
-                                    if any(cell['text'] for cell in row_data):
-                                        table_data['rows'].append(row_data)
+                                    row_data = [TableCell(cell.strip()) for cell in row]
+                                    if any(cell.text for cell in row_data):
+                                        table_data.rows.append(row_data)
 
-                    if table_data['rows']:
+                    if table_data.rows:
                         tables.append(table_data)
 
             return tables
 
         except Exception as e:
             warning_msg = f"Docling failed on page {page_num}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
+            logger.warning(warning_msg)
             ExtractionWarning.add(warning_msg)
             return []
 
-    def extract_tables_img2table(self, page_num: int) -> list[dict]:
+    def extract_tables_img2table(self, page_num: int) -> list[ExtractedTable]:
         """Extract tables using img2table - specialized for borderless tables.
 
         img2table uses whitespace and proximity analysis for column detection,
         making it effective for tables without visible borders.
 
         Returns same format as extract_tables_with_positions():
-        - 'rows': list of rows, each row is a list of cell dicts with 'text' and 'bbox'
-        - 'bbox': bounding box of entire table
+        ExtractedTable objects with the bounding box of the entire table and
+        rows of TableCell (text and bbox of each cell)
 
         Args:
             page_num: 1-indexed page number
 
         Returns:
-            List of table dicts with position data, or empty list if img2table unavailable
+            List of ExtractedTable with position data, or empty list if img2table unavailable
         """
         if not IMG2TABLE_AVAILABLE:
             return []
 
         try:
             # img2table uses 0-indexed pages
-            doc = Img2TablePDF(str(self.pdf_path), pages=[page_num - 1])
+            # img2table accepts the PDF bytes directly, so don't re-read the file
+            src = self._pdf_bytes if self._pdf_bytes is not None else self._pdf_path_str
+            doc = _img2table_pdf()(src, pages=[page_num - 1])
 
             # Extract tables with borderless detection enabled
             extracted = doc.extract_tables(borderless_tables=True)
@@ -748,44 +1649,36 @@ class PDFReader:
                     bbox = table.bbox
                     table_bbox = (bbox.x1, bbox.y1, bbox.x2, bbox.y2)
 
-                table_data = {
-                    'bbox': table_bbox,
-                    'rows': []
-                }
+                table_data = ExtractedTable(table_bbox)
 
                 # img2table provides content as a DataFrame or list
                 if hasattr(table, 'df') and table.df is not None:
                     df = table.df
-                    for _, row in df.iterrows():
-                        row_data = []
-                        for cell in row:
-                            cell_text = str(cell) if cell is not None else ''
-                            row_data.append({
-                                'text': cell_text.strip(),
-                                'bbox': None
-                            })
+                    # Plain lists instead of iterrows(), which builds a Series per row
+                    for row in df.to_numpy(dtype=object).tolist():
+                        row_data = [
+                            TableCell(str(cell).strip() if cell is not None else '')
+                            for cell in row
+                        ]
                         if row_data:
-                            table_data['rows'].append(row_data)
+                            table_data.rows.append(row_data)
                 elif hasattr(table, 'content') and table.content:
                     for row in table.content:
                         row_data = []
                         for cell in row:
                             cell_text = str(cell) if cell is not None else ''
-                            row_data.append({
-                                'text': cell_text.strip(),
-                                'bbox': None
-                            })
+                            row_data.append(TableCell(cell_text.strip()))
                         if row_data:
-                            table_data['rows'].append(row_data)
+                            table_data.rows.append(row_data)
 
-                if table_data['rows']:
+                if table_data.rows:
                     tables.append(table_data)
 
             return tables
 
         except Exception as e:
             warning_msg = f"img2table failed on page {page_num}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
+            logger.warning(warning_msg)
             ExtractionWarning.add(warning_msg)
             return []
 
@@ -806,57 +1699,78 @@ class PDFReader:
 
         try:
             # pymupdf4llm uses 0-indexed pages
-            markdown_text = pymupdf4llm.to_markdown(
-                str(self.pdf_path),
-                pages=[page_num - 1]
-            )
+            # Pass the reader's Document so the file isn't re-opened and re-parsed per page
+            doc = self._pymupdf_document()
+            with _pymupdf_lock:
+                markdown_text = _pymupdf4llm().to_markdown(
+                    doc if doc is not None else self._pdf_path_str,
+                    pages=[page_num - 1]
+                )
             return markdown_text
 
         except Exception as e:
             warning_msg = f"pymupdf4llm failed on page {page_num}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
+            logger.warning(warning_msg)
             ExtractionWarning.add(warning_msg)
             return ""
 
-    def extract_tables_unstructured(self, page_num: int) -> list[dict]:
+    def extract_tables_unstructured(self, page_num: int) -> list[ExtractedTable]:
         """Extract tables using unstructured.io - document understanding with layout analysis.
 
         Unstructured uses advanced document understanding to detect and extract
         structured content including tables, with good handling of various PDF types.
 
         Returns same format as extract_tables_with_positions():
-        - 'rows': list of rows, each row is a list of cell dicts with 'text' and 'bbox'
-        - 'bbox': bounding box of entire table
+        ExtractedTable objects with the bounding box of the entire table and
+        rows of TableCell (text and bbox of each cell)
 
         Args:
             page_num: 1-indexed page number
 
         Returns:
-            List of table dicts with position data, or empty list if unstructured unavailable
+            List of ExtractedTable with position data, or empty list if unstructured unavailable
         """
         if not UNSTRUCTURED_AVAILABLE:
             return []
 
         try:
-            # Partition the PDF - unstructured processes all pages, we filter by page
+            return self._unstructured_tables_by_page().get(page_num, [])
+        except Exception as e:
+            warning_msg = f"unstructured failed on page {page_num}: {e}"
+            logger.warning(warning_msg)
+            ExtractionWarning.add(warning_msg)
+            return []
+
+    def _unstructured_tables_by_page(self) -> dict[int, list[ExtractedTable]]:
+        """Return unstructured's tables for every page, partitioning the PDF once - thread-safe.
+
+        hi_res partitioning runs layout inference over the whole document, so
+        its tables are grouped by page and cached rather than redone per page.
+        """
+        with self._unstructured_lock:
+            if self._unstructured_tables is not None:
+                return self._unstructured_tables
+
             # Use hi_res strategy for better table detection
-            elements = partition_pdf(
-                filename=str(self.pdf_path),
+            if self._pdf_bytes is not None:
+                source = {'file': io.BytesIO(self._pdf_bytes)}
+            else:
+                source = {'filename': self._pdf_path_str}
+            elements = _partition_pdf()(
+                **source,
                 strategy="hi_res",
                 infer_table_structure=True,
             )
 
-            tables = []
+            tables: dict[int, list[ExtractedTable]] = {}
 
             for element in elements:
                 # Filter for table elements only
                 if element.category != "Table":
                     continue
 
-                # Filter by page number (unstructured uses 1-indexed page_number in metadata)
+                # unstructured uses 1-indexed page_number in metadata
                 element_page = getattr(element.metadata, 'page_number', None)
-                if element_page != page_num:
-                    continue
 
                 # Get bounding box if available
                 table_bbox = None
@@ -865,21 +1779,17 @@ class PDFReader:
                     points = coords.points
                     if points and len(points) >= 4:
                         # Convert points to (x1, y1, x2, y2) bbox
-                        xs = [p[0] for p in points]
-                        ys = [p[1] for p in points]
+                        xs, ys = zip(*points)
                         table_bbox = (min(xs), min(ys), max(xs), max(ys))
 
-                table_data = {
-                    'bbox': table_bbox,
-                    'rows': []
-                }
+                table_data = ExtractedTable(table_bbox)
 
                 # Try to get table as HTML and parse it
                 table_html = getattr(element.metadata, 'text_as_html', None)
                 if table_html:
                     # Parse HTML table structure
                     rows = self._parse_html_table(table_html)
-                    table_data['rows'] = rows
+                    table_data.rows = rows
                 else:
                     # Fallback: use element text, split into rows
                     text = str(element)
@@ -890,26 +1800,28 @@ class PDFReader:
                                 # Split by multiple spaces (likely column separator)
                                 cells = [c.strip() for c in line.split('  ') if c.strip()]
                                 if cells:
-                                    row_data = [{'text': cell, 'bbox': None} for cell in cells]
-                                    table_data['rows'].append(row_data)
+                                    row_data = [TableCell(cell) for cell in cells]
+                                    table_data.rows.append(row_data)
 
-                if table_data['rows']:
-                    tables.append(table_data)
+                if table_data.rows:
+                    tables.setdefault(element_page, []).append(table_data)
 
+            self._unstructured_tables = tables
             return tables
 
-        except Exception as e:
-            warning_msg = f"unstructured failed on page {page_num}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
-            ExtractionWarning.add(warning_msg)
-            return []
-
-    def _parse_html_table(self, html: str) -> list[list[dict]]:
-        """Parse HTML table string into rows of cell dicts.
+    def _parse_html_table(self, html: str) -> list[list[TableCell]]:
+        """Parse HTML table string into rows of cells.
 
         Uses proper HTML parser instead of regex for robust handling
-        of nested tags, entities, and malformed HTML.
+        of nested tags, entities, and malformed HTML - lxml's C parser
+        when available, else the standard library's.
         """
+        if LXML_AVAILABLE:
+            try:
+                return self._parse_html_table_lxml(html)
+            except Exception:
+                pass  # Fall back to the standard library parser
+
         from html.parser import HTMLParser
         from html import unescape
 
@@ -960,86 +1872,250 @@ class PDFReader:
             parser.feed(html)
         except Exception:
             # Fallback to simple regex if parsing fails
-            import re
             rows = []
-            row_matches = re.findall(r'<tr[^>]*>(.*?)</tr>', html, re.DOTALL | re.IGNORECASE)
-            for row_html in row_matches:
+            for row_html in _HTML_ROW_PATTERN.findall(html):
                 row_data = []
-                cell_matches = re.findall(r'<t[dh][^>]*>(.*?)</t[dh]>', row_html, re.DOTALL | re.IGNORECASE)
-                for cell_html in cell_matches:
-                    cell_text = re.sub(r'<[^>]+>', '', cell_html).strip()
-                    row_data.append({'text': cell_text, 'bbox': None})
+                for cell_html in _HTML_CELL_PATTERN.findall(row_html):
+                    cell_text = _HTML_TAG_PATTERN.sub('', cell_html).strip()
+                    row_data.append(TableCell(cell_text))
                 if row_data:
                     rows.append(row_data)
             return rows
 
         # Convert parsed rows to expected format
-        return [[{'text': cell, 'bbox': None} for cell in row] for row in parser.rows]
-
-    def extract_tables_pymupdf(self, page_num: int) -> list[dict]:
+        return [[TableCell(cell) for cell in row] for row in parser.rows]
+
+    @staticmethod
+    def _parse_html_table_lxml(html: str) -> list[list[TableCell]]:
+        """Parse HTML table string into rows of cells with lxml."""
+        root = _lxml_html().fromstring(html)
+        # <br> inside a cell separates words, as in the standard library parser
+        for br in root.iter('br'):
+            br.tail = ' ' + (br.tail or '')
+
+        rows = []
+        for tr in root.iter('tr'):
+            row_data = [TableCell(cell.text_content().strip()) for cell in tr if cell.tag in ('td', 'th')]
+            if row_data:
+                rows.append(row_data)
+        return rows
+
+    def extract_tables_pymupdf(self, page_num: int) -> list[ExtractedTable]:
         """Extract tables using PyMuPDF (fitz) - fast native table detection.
 
         PyMuPDF has built-in table finding capabilities via find_tables() method.
         Very fast and handles both bordered and some borderless tables.
 
         Returns same format as extract_tables_with_positions():
-        - 'rows': list of rows, each row is a list of cell dicts with 'text' and 'bbox'
-        - 'bbox': bounding box of entire table
+        ExtractedTable objects with the bounding box of the entire table and
+        rows of TableCell (text and bbox of each cell)
 
         Args:
             page_num: 1-indexed page number
 
         Returns:
-            List of table dicts with position data, or empty list if PyMuPDF unavailable
+            List of ExtractedTable with position data, or empty list if PyMuPDF unavailable
         """
         if not PYMUPDF_AVAILABLE:
             return []
 
         try:
-            # Use context manager to ensure document is closed even on exception
-            with pymupdf.open(str(self.pdf_path)) as doc:
-                # PyMuPDF uses 0-indexed pages
-                page = doc[page_num - 1]
+            # Reuse the reader's in-memory Document when open; otherwise open the
+            # file, with a context manager to ensure it's closed even on exception
+            doc = self._pymupdf_document()
+            # Opening the fallback Document goes through MuPDF too, so it
+            # happens under the lock along with the table search
+            with _pymupdf_lock:
+                doc_context = nullcontext(doc) if doc is not None else pymupdf.open(self._pdf_path_str)
+                with doc_context as doc:
+                    # PyMuPDF uses 0-indexed pages
+                    page = doc[page_num - 1]
+
+                    # Find tables on the page
+                    tabs = page.find_tables()
+                    tables = []
+
+                    for tab in tabs:
+                        # Get table bounding box
+                        table_bbox = tuple(tab.bbox) if tab.bbox else None
+
+                        table_data = ExtractedTable(table_bbox)
+
+                        # Extract table content
+                        # tab.extract() returns list of rows, each row is list of cell strings
+                        for row in tab.extract():
+                            row_data = []
+                            for cell in row:
+                                cell_text = str(cell) if cell is not None else ''
+                                row_data.append(TableCell(cell_text.strip()))
+                            if row_data:
+                                table_data.rows.append(row_data)
+
+                        if table_data.rows:
+                            tables.append(table_data)
+
+                    return tables
 
-                # Find tables on the page
-                tabs = page.find_tables()
-                tables = []
+        except Exception as e:
+            warning_msg = f"PyMuPDF failed on page {page_num}: {e}"
+            logger.warning(warning_msg)
+            ExtractionWarning.add(warning_msg)
+            return []
 
-                for tab in tabs:
-                    # Get table bounding box
-                    table_bbox = tuple(tab.bbox) if tab.bbox else None
+    def extract_tables_pymupdf_batch(
+        self,
+        page_numbers: Iterable[int],
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> dict[int, list[ExtractedTable]]:
+        """Extract PyMuPDF tables for many pages in a process pool.
 
-                    table_data = {
-                        'bbox': table_bbox,
-                        'rows': []
-                    }
+        MuPDF isn't thread-safe, even across separate documents, so pages are
+        split into batches and handled by worker processes that each open the
+        PDF once, as in iter_pages_parallel(). Runs serially on this reader
+        when there is a single worker or everything fits in a single batch.
 
-                    # Extract table content
-                    # tab.extract() returns list of rows, each row is list of cell strings
-                    for row in tab.extract():
-                        row_data = []
-                        for cell in row:
-                            cell_text = str(cell) if cell is not None else ''
-                            row_data.append({
-                                'text': cell_text.strip(),
-                                'bbox': None
-                            })
-                        if row_data:
-                            table_data['rows'].append(row_data)
+        Args:
+            page_numbers: 1-indexed page numbers
+            max_workers: Number of worker processes (default: CPU count - 1)
+            chunk_size: Pages per worker task (default as iter_pages_parallel())
 
-                    if table_data['rows']:
-                        tables.append(table_data)
+        Returns:
+            Dict of page number -> list of ExtractedTable, as extract_tables_pymupdf()
+        """
+        page_numbers = list(page_numbers)
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+        if chunk_size is None:
+            chunk_size = max(self.MIN_PARALLEL_CHUNK, math.ceil(len(page_numbers) / (max_workers * 4)))
+        if not PYMUPDF_AVAILABLE or max_workers <= 1 or len(page_numbers) <= chunk_size:
+            return {page_num: self.extract_tables_pymupdf(page_num) for page_num in page_numbers}
+
+        batches = [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+        results: dict[int, list[ExtractedTable]] = {}
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(batches)),
+            mp_context=self._worker_mp_context(),
+            initializer=_init_page_worker,
+            initargs=(self.pdf_path, self.text_backend),
+        ) as executor:
+            for batch_results in executor.map(_extract_pymupdf_table_batch, batches):
+                results.update(batch_results)
+        return results
+
+    def extract_tables_smart(
+        self, page_number: int, strategies: Optional[Iterable[str]] = None
+    ) -> list[ExtractedTable]:
+        """Extract tables with the cheapest backend that suits this PDF.
+
+        Backends are tried in the order _SMART_TABLE_RULES gives for the
+        classify_pdf() result, skipping unavailable ones, until one finds
+        tables. Pages of a catalog tend to look alike, so the backend that
+        last found tables is tried first.
 
+        Args:
+            page_number: 1-indexed page number
+            strategies: Backends to try, in this exact order, instead of the
+                classification-based order (e.g. ("pymupdf", "pdfplumber", "unstructured"))
+
+        Returns:
+            List of ExtractedTable, as extract_tables_with_positions()
+        """
+        backends = {
+            "pdfplumber": (True, self.extract_tables_with_positions),
+            "pymupdf": (PYMUPDF_AVAILABLE, self.extract_tables_pymupdf),
+            "camelot": (CAMELOT_AVAILABLE, self.extract_tables_camelot),
+            "img2table": (IMG2TABLE_AVAILABLE, self.extract_tables_img2table),
+            "docling": (DOCLING_AVAILABLE, self.extract_tables_docling),
+            "unstructured": (UNSTRUCTURED_AVAILABLE, self.extract_tables_unstructured),
+        }
+
+        if strategies is not None:
+            order = tuple(strategies)
+            unknown = [b for b in order if b not in backends]
+            if unknown:
+                raise ValueError(f"Unknown table backend(s): {', '.join(unknown)}")
+        else:
+            info = self.classify_pdf()
+            order = _SMART_TABLE_RULES.get(
+                "scanned" if info['is_scanned'] else info['layout_type'],
+                _SMART_TABLE_RULES["mixed"],
+            )
+            if self._smart_table_backend in order:
+                order = (self._smart_table_backend, *(b for b in order if b != self._smart_table_backend))
+
+        for backend in order:
+            available, extract = backends[backend]
+            if not available:
+                continue
+            tables = extract(page_number)
+            if tables:
+                self._smart_table_backend = backend
                 return tables
+        return []
 
-        except Exception as e:
-            warning_msg = f"PyMuPDF failed on page {page_num}: {e}"
-            print(f"Warning: {warning_msg}", file=sys.stderr)
-            ExtractionWarning.add(warning_msg)
-            return []
+
+# Per-process reader for iter_pages_parallel() workers
+_worker_reader: Optional[PDFReader] = None
+
+
+def _init_page_worker(pdf_path: Path, text_backend: str) -> None:
+    """Open the PDF once per worker process; it stays open for the worker's lifetime."""
+    global _worker_reader
+    _worker_reader = PDFReader(pdf_path, text_backend=text_backend).__enter__()
+
+
+def _extract_page_batch(page_numbers: range) -> list[PageContent]:
+    """Extract a batch of pages in a worker process."""
+    return [_worker_reader.get_page(page_num, flush=True) for page_num in page_numbers]
+
+
+def _extract_pymupdf_table_batch(page_numbers: list[int]) -> dict[int, list[ExtractedTable]]:
+    """Extract PyMuPDF tables for a batch of pages in a worker process."""
+    return {page_num: _worker_reader.extract_tables_pymupdf(page_num) for page_num in page_numbers}
+
+
+def read_pdfs(
+    pdf_paths: Iterable[Path], max_workers: int = 8, **kwargs
+) -> Iterator[PDFReader]:
+    """Yield unopened readers for many PDFs, reading files ahead in threads.
+
+    Up to 2 * max_workers files are read in the background while the caller
+    parses earlier ones, overlapping disk I/O with CPU-bound extraction.
+    Only helps when reading is a significant cost (cold cache, network
+    storage, many small PDFs). Readers are yielded in input order; keyword
+    arguments are passed on to PDFReader.
+    """
+    paths = iter(pdf_paths)
+    pending: deque = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for path in paths:
+                pending.append((path, executor.submit(Path(path).read_bytes)))
+                if len(pending) >= 2 * max_workers:
+                    path, future = pending.popleft()
+                    yield PDFReader.from_bytes(future.result(), path, **kwargs)
+            while pending:
+                path, future = pending.popleft()
+                yield PDFReader.from_bytes(future.result(), path, **kwargs)
+        finally:
+            executor.shutdown(cancel_futures=True)
 
 
 def quick_page_count(pdf_path: Path) -> int:
-    """Get page count without keeping PDF open."""
+    """Get page count without keeping PDF open.
+
+    Reads /Count from the document's page tree root instead of building
+    every page object; falls back to pdfplumber if that entry is unusable.
+    """
+    try:
+        with open(pdf_path, 'rb') as f:
+            document = PDFDocument(PDFParser(f))
+            count = resolve1(resolve1(document.catalog['Pages'])['Count'])
+        if isinstance(count, int) and count >= 0:
+            return count
+    except Exception:
+        pass
+
     with pdfplumber.open(pdf_path) as pdf:
         return len(pdf.pages)
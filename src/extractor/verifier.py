@@ -1,5 +1,6 @@
 """Page-by-page verification of extracted data."""
 
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 
@@ -21,14 +22,12 @@ class Verifier:
     def __init__(self, pdf_path: Path, session: ExtractionSession):
         self.pdf_path = Path(pdf_path)
         self.session = session
-        self.products_by_page: dict[int, list[Product]] = {}
+        # Lookups use .get() so that browsing a page doesn't add an empty entry
+        self.products_by_page: defaultdict[int, list[Product]] = defaultdict(list)
 
         # Group products by page
         for product in session.products:
-            page_num = product.page_number
-            if page_num not in self.products_by_page:
-                self.products_by_page[page_num] = []
-            self.products_by_page[page_num].append(product)
+            self.products_by_page[product.page_number].append(product)
 
     def display_comparison(self, page: PageContent) -> None:
         """Display page content alongside extracted products."""
@@ -199,8 +198,6 @@ class Verifier:
                     product = self.add_product(page_num)
                     if product:
                         self.session.add_product(product)
-                        if page_num not in self.products_by_page:
-                            self.products_by_page[page_num] = []
                         self.products_by_page[page_num].append(product)
                         console.print("[green]Product added![/green]")
 
@@ -15,7 +15,13 @@ import fitz  # PyMuPDF
 from flask import Flask, render_template, jsonify, request, send_file
 from werkzeug.utils import secure_filename
 
-from .data_model import Product, ExtractionSession, FieldLocation
+from .data_model import (
+    Product,
+    ExtractionSession,
+    FieldLocation,
+    find_session_file,
+    find_session_files,
+)
 from .exporter import export_to_csv
 
 # Maximum length for product text fields to prevent resource exhaustion
@@ -131,12 +137,8 @@ def list_catalogs() -> list[dict]:
     for pdf in CATALOGS_DIR.glob("*.PDF"):
         pdf_files[pdf.stem] = pdf
 
-    # Find all sessions
-    sessions = {}
-    for session_file in SESSIONS_DIR.glob("*.session.json"):
-        # stem gives "foo.session", use removesuffix for cleaner handling
-        name = session_file.stem.removesuffix('.session')
-        sessions[name] = session_file
+    # Find all sessions (JSON or MessagePack snapshots)
+    sessions = find_session_files(SESSIONS_DIR)
 
     # Find all exports
     exports = set()
@@ -246,8 +248,8 @@ def index():
         if catalog_name:
             # Load session and switch catalog within lock to prevent race conditions
             with _state_lock:
-                session_path = SESSIONS_DIR / f"{catalog_name}.session.json"
-                if session_path.exists():
+                session_path = find_session_file(SESSIONS_DIR, catalog_name)
+                if session_path is not None:
                     session = ExtractionSession.load(session_path)
                     if session:
                         # Find PDF
@@ -477,8 +479,8 @@ def get_extraction_status(catalog_name: str):
             })
 
     # Not in jobs - check if session exists (do this outside lock to avoid blocking)
-    session_path = SESSIONS_DIR / f"{catalog_name}.session.json"
-    if session_path.exists():
+    session_path = find_session_file(SESSIONS_DIR, catalog_name)
+    if session_path is not None:
         session = ExtractionSession.load(session_path)
         if session:
             return jsonify({
@@ -506,8 +508,8 @@ def switch_catalog(catalog_name: str):
         return jsonify({'error': 'Invalid catalog name'}), 400
 
     # Find session
-    session_path = SESSIONS_DIR / f"{catalog_name}.session.json"
-    if not session_path.exists():
+    session_path = find_session_file(SESSIONS_DIR, catalog_name)
+    if session_path is None:
         return jsonify({'error': 'Session not found. Extract the catalog first.'}), 404
 
     session = ExtractionSession.load(session_path)
@@ -44,13 +44,13 @@ def test_docling_extraction(pdf_path: str, page_num: int = 1):
 
         for i, table in enumerate(tables):
             print(f"\n=== Table {i+1} ===")
-            print(f"BBox: {table.get('bbox')}")
-            print(f"Rows: {len(table.get('rows', []))}")
+            print(f"BBox: {table.bbox}")
+            print(f"Rows: {len(table.rows)}")
 
             # Print first few rows
-            rows = table.get('rows', [])
+            rows = table.rows
             for j, row in enumerate(rows[:5]):  # Show first 5 rows
-                row_text = [cell.get('text', '') for cell in row]
+                row_text = [cell.text for cell in row]
                 print(f"  Row {j}: {row_text}")
 
             if len(rows) > 5:
@@ -0,0 +1,43 @@
+"""Shared fixtures for the extractor tests."""
+
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+
+# Rows of the price table drawn on every page of the sample catalog
+CATALOG_ROWS = [
+    ("Item #", "Description", "Price"),
+    ("A-100", "Hex bolt M6", "0.25"),
+    ("A-101", "Hex bolt M8", "0.40"),
+    ("B-200", "Washer 6mm", "0.05"),
+]
+
+
+@pytest.fixture(scope="session")
+def catalog_rows() -> list[tuple[str, str, str]]:
+    """Rows of the price table in catalog_pdf, header first."""
+    return CATALOG_ROWS
+
+
+@pytest.fixture(scope="session")
+def catalog_pdf(tmp_path_factory) -> Path:
+    """A small multi-page catalog: a heading and a ruled price table per page."""
+    path = tmp_path_factory.mktemp("pdf") / "catalog.pdf"
+    doc = pymupdf.open()
+    for page_num in range(1, 7):
+        page = doc.new_page()
+        page.insert_text((50, 60), f"Fasteners - section {page_num}", fontsize=14)
+        for row_idx, row in enumerate(CATALOG_ROWS):
+            y = 100 + row_idx * 20
+            page.draw_line((50, y), (500, y))
+            for col_idx, text in enumerate(row):
+                page.insert_text((55 + col_idx * 150, y + 14), text, fontsize=10)
+        bottom = 100 + len(CATALOG_ROWS) * 20
+        page.draw_line((50, bottom), (500, bottom))
+        for x in (50, 200, 350, 500):
+            page.draw_line((x, 100), (x, bottom))
+    doc.save(path)
+    doc.close()
+    return path
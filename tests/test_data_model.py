@@ -0,0 +1,164 @@
+"""Tests for session persistence: snapshots, the journal and their formats."""
+
+import pytest
+
+from extractor import data_model
+from extractor.data_model import ExtractionSession, FieldLocation, Product, find_session_file
+
+
+def make_product(name: str, page: int) -> Product:
+    return Product(
+        product_name=name,
+        item_no=f"SKU-{name}",
+        pkg="12",
+        uom="EA",
+        page_number=page,
+        source_file="catalog.pdf",
+        field_locations={"product_name": FieldLocation(10.0, 20.0, 110.0, 32.5, page, 0.9)},
+    )
+
+
+def make_session(products: int = 3) -> ExtractionSession:
+    session = ExtractionSession(source_file="catalog.pdf", total_pages=10)
+    for i in range(products):
+        session.add_product(make_product(f"p{i}", i + 1))
+    return session
+
+
+def session_files(session_dir):
+    return sorted(path.name for path in session_dir.iterdir())
+
+
+@pytest.fixture
+def msgpack_available():
+    pytest.importorskip("msgspec")
+
+
+def test_journal_replayed_on_load(tmp_path):
+    session = make_session(0)
+    session.save(tmp_path)
+    session.append_page([make_product("a", 1)], 2, tmp_path)
+    session.append_page([make_product("b", 2), make_product("c", 2)], 3, tmp_path)
+
+    # No save since the pages were journaled, as after a crash
+    loaded = ExtractionSession.load(tmp_path / "catalog.session.json")
+    assert [p.product_name for p in loaded.products] == ["a", "b", "c"]
+    assert loaded.current_page == 3
+    assert loaded.products == session.products
+
+
+def test_journal_ignores_torn_record(tmp_path):
+    session = make_session(0)
+    session.save(tmp_path)
+    journal = session.append_product(make_product("a", 1), tmp_path)
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"product_name": "b", "page_nu')
+
+    loaded = ExtractionSession.load(tmp_path / "catalog.session.json")
+    assert [p.product_name for p in loaded.products] == ["a"]
+
+
+def test_journal_replay_skips_products_already_in_snapshot(tmp_path):
+    session = make_session(0)
+    session.save(tmp_path)
+    journal = session.append_product(make_product("a", 1), tmp_path)
+    records = journal.read_text(encoding="utf-8")
+    session.save(tmp_path)
+    # A crash between writing the snapshot and removing the journal
+    journal.write_text(records, encoding="utf-8")
+
+    loaded = ExtractionSession.load(tmp_path / "catalog.session.json")
+    assert [p.product_name for p in loaded.products] == ["a"]
+
+
+def test_save_clears_journal(tmp_path):
+    session = make_session(0)
+    session.save(tmp_path)
+    session.append_page([make_product("a", 1)], 2, tmp_path)
+    session.save(tmp_path)
+
+    assert session_files(tmp_path) == ["catalog.session.json"]
+    assert ExtractionSession.load(tmp_path / "catalog.session.json").current_page == 2
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_journal_compaction(tmp_path, monkeypatch, binary):
+    if binary:
+        pytest.importorskip("msgspec")
+    monkeypatch.setattr(data_model, "JOURNAL_COMPACT_THRESHOLD", 3)
+    session = make_session(0)
+    session.save(tmp_path, binary=binary)
+    snapshot = session_files(tmp_path)
+
+    session.append_product(make_product("a", 1), tmp_path)
+    session.append_product(make_product("b", 1), tmp_path)
+    assert len(session_files(tmp_path)) == 2
+    session.append_page([make_product("c", 1)], 2, tmp_path)
+
+    # The third record triggers a full save in the same format, journal gone
+    assert session_files(tmp_path) == snapshot
+    loaded = ExtractionSession.load(tmp_path / snapshot[0])
+    assert [p.product_name for p in loaded.products] == ["a", "b", "c"]
+    assert loaded.current_page == 2
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_round_trip(tmp_path, pretty):
+    session = make_session()
+    session.current_page = 4
+    path = session.save(tmp_path, pretty=pretty)
+
+    loaded = ExtractionSession.load(path)
+    assert loaded == session
+    assert loaded.products[0].field_locations == session.products[0].field_locations
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 10**9])
+def test_msgpack_round_trip(tmp_path, monkeypatch, msgpack_available, mmap_threshold):
+    # Threshold 0 loads through mmap, a huge one through read()
+    monkeypatch.setattr(data_model, "MMAP_THRESHOLD", mmap_threshold)
+    session = make_session()
+    session.current_page = 4
+    path = session.save(tmp_path, binary=True)
+
+    assert path.name == "catalog.session.msgpack"
+    loaded = ExtractionSession.load(path)
+    assert loaded == session
+    assert loaded.products[0].field_locations == session.products[0].field_locations
+
+
+def test_switching_format_keeps_one_snapshot(tmp_path, msgpack_available):
+    session = make_session(1)
+    session.save(tmp_path)
+    session.append_page([make_product("a", 2)], 3, tmp_path)
+    session.save(tmp_path, binary=True)
+    assert session_files(tmp_path) == ["catalog.session.msgpack"]
+
+    # Without a format argument, later saves and the journal stay in msgpack
+    loaded = ExtractionSession.load(find_session_file(tmp_path, "catalog"))
+    loaded.append_page([make_product("b", 3)], 4, tmp_path)
+    assert session_files(tmp_path) == ["catalog.session.msgpack", "catalog.session.msgpack.jsonl"]
+    reloaded = ExtractionSession.load(find_session_file(tmp_path, "catalog"))
+    assert [p.product_name for p in reloaded.products] == ["p0", "a", "b"]
+    assert reloaded.current_page == 4
+
+    reloaded.save(tmp_path)
+    assert session_files(tmp_path) == ["catalog.session.msgpack"]
+
+    reloaded.save(tmp_path, binary=False)
+    assert session_files(tmp_path) == ["catalog.session.json"]
+    assert ExtractionSession.load(find_session_file(tmp_path, "catalog")) == reloaded
+
+
+def test_find_session_file(tmp_path, msgpack_available):
+    assert find_session_file(tmp_path, "catalog") is None
+    make_session().save(tmp_path, binary=True)
+    assert find_session_file(tmp_path, "catalog") == tmp_path / "catalog.session.msgpack"
+    assert data_model.find_session_files(tmp_path) == {"catalog": tmp_path / "catalog.session.msgpack"}
+
+
+def test_load_missing_or_corrupt(tmp_path):
+    assert ExtractionSession.load(tmp_path / "missing.session.json") is None
+    corrupt = tmp_path / "corrupt.session.json"
+    corrupt.write_text("{not json", encoding="utf-8")
+    assert ExtractionSession.load(corrupt) is None
@@ -0,0 +1,140 @@
+"""Tests for PDFReader."""
+
+import pymupdf
+import pytest
+
+from extractor import pdf_reader
+from extractor.pdf_reader import ExtractionWarning, PDFReader, quick_page_count
+
+
+@pytest.fixture(autouse=True)
+def clear_warnings():
+    ExtractionWarning.clear()
+    yield
+    ExtractionWarning.clear()
+
+
+@pytest.mark.parametrize("opened", [True, False])
+def test_layout_out_of_range_pages_are_empty(catalog_pdf, opened):
+    reader = PDFReader(catalog_pdf)
+    with reader:
+        total_pages = reader.total_pages
+        if opened:
+            blocks = reader.extract_text_with_layout_range([0, 1, total_pages, total_pages + 1])
+
+    if not opened:
+        blocks = reader.extract_text_with_layout_range([0, 1, total_pages, total_pages + 1])
+
+    assert blocks[0] == []
+    assert blocks[total_pages + 1] == []
+    assert blocks[1] and blocks[total_pages]
+    # Page 0 must not wrap around to the last page
+    assert "section 1" in blocks[1][0]["text"]
+    assert ExtractionWarning.get_all() == []
+
+
+def test_layout_single_page_out_of_range(catalog_pdf):
+    with PDFReader(catalog_pdf) as reader:
+        assert reader.extract_text_with_layout(0) == []
+        assert reader.extract_text_with_layout(reader.total_pages + 1) == []
+    assert ExtractionWarning.get_all() == []
+
+
+def test_classify_ruled_catalog(catalog_pdf):
+    with PDFReader(catalog_pdf) as reader:
+        info = reader.classify_pdf()
+    assert info["layout_type"] == "tabular"
+    assert info["has_text"] and info["has_borders"]
+    assert not info["is_scanned"]
+    assert info["pages_with_tables"] == 3
+
+
+def test_classify_prose(tmp_path):
+    path = tmp_path / "prose.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()
+    sentence = "Fasteners are supplied in boxes of one hundred unless noted. "
+    page.insert_textbox(pymupdf.Rect(50, 50, 550, 800), sentence * 20, fontsize=10)
+    doc.save(path)
+    doc.close()
+
+    with PDFReader(path) as reader:
+        info = reader.classify_pdf()
+    assert info["layout_type"] == "borderless"
+    assert info["has_text"] and not info["has_borders"]
+    assert info["pages_with_tables"] == 0
+
+
+def test_failed_optional_import_disables_backend(monkeypatch):
+    monkeypatch.setattr(pdf_reader, "IMG2TABLE_AVAILABLE", True)
+    attempts = []
+
+    @pdf_reader._optional_import("img2table", "IMG2TABLE_AVAILABLE")
+    def loader():
+        attempts.append(1)
+        raise ImportError("No module named 'cv2'")
+
+    for _ in range(3):
+        with pytest.raises(ImportError):
+            loader()
+
+    # Imported once, flag cleared for later backend selection, warned once
+    assert attempts == [1]
+    assert pdf_reader.IMG2TABLE_AVAILABLE is False
+    assert len(ExtractionWarning.get_all()) == 1
+
+
+def test_get_page_keeps_original_text(catalog_pdf):
+    with PDFReader(catalog_pdf) as reader:
+        page = reader.get_page(1)
+        original = reader._get_pdfplumber_page(1).extract_text()
+
+    assert page.raw_text == original
+    assert page.lines == [line.strip() for line in original.splitlines() if line.strip()]
+
+
+def page_snapshot(pages):
+    return [(page.page_number, page.lines, page.raw_text) for page in pages]
+
+
+def test_page_iteration_strategies_agree(catalog_pdf):
+    with PDFReader(catalog_pdf) as reader:
+        expected = page_snapshot([reader.get_page(n) for n in range(1, reader.total_pages + 1)])
+        serial = page_snapshot(reader.iter_pages())
+        prefetched = page_snapshot(reader.iter_pages(prefetch=2))
+        # Small chunks force a real process pool on this short document
+        parallel = page_snapshot(reader.iter_pages_parallel(max_workers=2, chunk_size=2))
+        auto = page_snapshot(reader.iter_pages_auto())
+
+    assert len(expected) == 6
+    assert serial == expected
+    assert prefetched == expected
+    assert parallel == expected
+    assert auto == expected
+
+
+def test_page_iteration_from_start_page(catalog_pdf):
+    with PDFReader(catalog_pdf) as reader:
+        serial = page_snapshot(reader.iter_pages(4))
+        prefetched = page_snapshot(reader.iter_pages(4, prefetch=2, end_page=5))
+        parallel = page_snapshot(reader.iter_pages_parallel(4, max_workers=2, chunk_size=1))
+
+    assert [page[0] for page in serial] == [4, 5, 6]
+    assert prefetched == serial[:2]
+    assert parallel == serial
+
+
+def test_quick_page_count(catalog_pdf):
+    assert quick_page_count(catalog_pdf) == 6
+
+
+def test_extract_tables_smart(catalog_pdf, catalog_rows):
+    with PDFReader(catalog_pdf) as reader:
+        tables = reader.extract_tables_smart(2)
+        assert [cell.text for cell in tables[0].rows[0]] == list(catalog_rows[0])
+
+        explicit = reader.extract_tables_smart(2, strategies=("pdfplumber",))
+        assert [[cell.text for cell in row] for row in explicit[0].rows] == [list(row) for row in catalog_rows]
+
+        with pytest.raises(ValueError):
+            reader.extract_tables_smart(2, strategies=("nonexistent",))